@@ -0,0 +1,52 @@
+"""Cost of the content scoring (ContentExtractor.calculate_best_node) and of the output formatting as the number
+of paragraphs of an article grows; the cost per paragraph should stay flat
+
+Usage: python benchmarks/content_scoring.py [largest number of paragraphs]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from goose3 import Configuration  # noqa: E402
+from goose3.crawler import Crawler, CrawlCandidate  # noqa: E402
+
+PARAGRAPH = (
+    "<p>This is the paragraph number {} of the article, with the words the stop words of the language are made of"
+    " and a <a href='#'>link</a> in the middle of it so that it looks like the paragraphs of a real article.</p>"
+)
+
+
+def build_html(paragraphs):
+    body = "".join(PARAGRAPH.format(i) for i in range(paragraphs))
+    return f"<html><head><title>Benchmark</title></head><body><div class='article'>{body}</div></body></html>"
+
+
+def measure(paragraphs):
+    """Time of the content scoring and of the formatter of an article of `paragraphs` paragraphs"""
+    config = Configuration()
+    config.enable_instrumentation = True
+    crawler = Crawler(config)
+    html = build_html(paragraphs)
+    article = crawler.crawl(CrawlCandidate(config, None, html))
+    timings = article.timings
+    return timings["calculate_best_node"]["wall"], timings["post_cleanup"]["wall"], timings["formatter"]["wall"]
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 1600
+    paragraphs = 100
+    print(f"{'paragraphs':>10} {'scoring':>12} {'post cleanup':>14} {'formatter':>12} {'per paragraph':>14}")
+    while paragraphs <= largest:
+        best = min((measure(paragraphs) for _ in range(3)), key=sum)
+        total = sum(best)
+        print(
+            f"{paragraphs:>10} {best[0] * 1000:>9.1f} ms {best[1] * 1000:>11.1f} ms {best[2] * 1000:>9.1f} ms"
+            f" {total * 1e6 / paragraphs:>11.1f} us"
+        )
+        paragraphs *= 2
+
+
+if __name__ == "__main__":
+    main()
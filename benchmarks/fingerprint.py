@@ -0,0 +1,36 @@
+"""Cost per MB of the fingerprint algorithms used for the link_hash of an article
+
+Usage: python benchmarks/fingerprint.py [size in MB]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from goose3.utils import FINGERPRINT_ALGORITHMS  # noqa: E402
+
+CURRENT_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_html(size):
+    """Build a document of `size` bytes out of the html of the test suite"""
+    path = os.path.join(CURRENT_PATH, "..", "tests", "data", "content", "test_cnn1.html")
+    with open(path, "rb") as fobj:
+        html = fobj.read()
+    return (html * (size // len(html) + 1))[:size]
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    html = load_html(int(size_mb * 1024 * 1024))
+    print(f"document size: {len(html) / 1024 / 1024:.2f} MB")
+    for name, func in FINGERPRINT_ALGORITHMS.items():
+        number = 1 if name == "fnv_1a" else 100
+        seconds = min(timeit.repeat(lambda: func(html), number=number, repeat=3)) / number
+        print(f"{name:>8}: {seconds * 1000 / size_mb:10.3f} ms per MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Cost per call of Parser.get_elements_by_tag with and without the cache of compiled XPath expressions
+
+Usage: python benchmarks/xpath.py [number of calls]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from goose3.parsers import XPATH_NAMESPACES, Parser  # noqa: E402
+
+CURRENT_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# calls made by the extractors
+CALLS = [
+    {"tag": "meta", "attr": "name", "value": "headline"},
+    {"tag": "link", "attr": "rel", "value": "canonical"},
+    {"tag": "a", "attr": "rel", "value": "tag"},
+    {"tag": "title"},
+    {"tag": "p"},
+]
+
+
+def uncached(node, tag=None, attr=None, value=None, childs=False):
+    """get_elements_by_tag before the cache: the expression is compiled on each call"""
+    sel = tag or "*"
+    selector = f"descendant-or-self::{sel}"
+    if attr and value:
+        selector = f'{selector}[re:test(@{attr}, "{value}", "i")]'
+    elems = node.xpath(selector, namespaces=XPATH_NAMESPACES)
+    if node in elems and (tag or childs):
+        elems.remove(node)
+    return elems
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    path = os.path.join(CURRENT_PATH, "..", "tests", "data", "content", "test_cnn1.html")
+    with open(path, encoding="utf-8") as fobj:
+        doc = Parser.fromstring(fobj.read())
+    # a small subtree, where the compilation is most of the cost, and the whole document
+    small = Parser.get_elements_by_tag(doc, tag="head")[0]
+    for name, node in [("head", small), ("document", doc)]:
+        print(f"context: {name}")
+        for kwargs in CALLS:
+            before = min(timeit.repeat(lambda: uncached(node, **kwargs), number=number, repeat=3)) / number
+            after = min(timeit.repeat(lambda: Parser.get_elements_by_tag(node, **kwargs), number=number, repeat=3))
+            after /= number
+            label = ", ".join(f"{key}={val}" for key, val in kwargs.items())
+            print(f"  {label:>35}: {before * 1e6:8.1f} us -> {after * 1e6:8.1f} us")
+    print(Parser.xpath_cache_info())
+
+
+if __name__ == "__main__":
+    main()
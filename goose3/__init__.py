@@ -20,21 +20,27 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 import os
+import threading
 import weakref
 from tempfile import mkstemp
-from typing import List, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
 from goose3.article import Article  # noqa: F401
+from goose3.batch import BatchItem, BatchResult, iter_batch
 from goose3.configuration import ArticleContextPattern, AuthorPattern, Configuration, PublishDatePattern  # noqa: F401
 from goose3.crawler import CrawlCandidate, Crawler
 from goose3.image import Image  # noqa: F401
-from goose3.network import NetworkFetcher
+from goose3.network import AsyncNetworkFetcher, NetworkFetcher
 from goose3.video import Video  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+# idle crawlers kept around by a Goose instance; the ones released beyond are dropped
+MAX_IDLE_CRAWLERS = 8
+
 
 class Goose:
     """Extract most likely article content and aditional metadata from a URL or previously fetched HTML document
@@ -60,6 +66,11 @@ class Goose:
 
         # setup a single network connection
         self.fetcher = NetworkFetcher(self.config)
+        # the asyncio connection is only setup when the asyncio api is used
+        self.async_fetcher = None
+        # idle crawlers kept around to be reused by the next extractions
+        self._crawlers: List[Crawler] = []
+        self._crawlers_lock = threading.Lock()
         self.finalizer = weakref.finalize(self, self.close)
 
         # we don't need to go further if image extractor or local_storage is not set
@@ -98,6 +109,14 @@ class Goose:
         """Define what to do when the context manager exits"""
         self.close()
 
+    async def __aenter__(self):
+        """Setup the asynchronous context manager"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Define what to do when the asynchronous context manager exits"""
+        await self.aclose()
+
     def close(self):
         """Close the network connection and perform any other required cleanup
 
@@ -105,23 +124,127 @@ class Goose:
             Auto closed when using goose as a context manager or when garbage collected"""
         if self.fetcher is not None:
             self.shutdown_network()
+        if self.async_fetcher is not None:
+            self.async_fetcher.close()
+            self.async_fetcher = None
+        with self._crawlers_lock:
+            self._crawlers = []
         self.finalizer.atexit = False  # turn off the garbage collection close
 
-    def extract(self, url: Union[str, None] = None, raw_html: Union[str, None] = None) -> Article:
+    async def aclose(self):
+        """Close the asyncio network connection along with everything `close` cleans up
+
+        Note:
+            Auto closed when using goose as an asynchronous context manager"""
+        if self.async_fetcher is not None:
+            await self.async_fetcher.aclose()
+        self.close()
+
+    def extract(
+        self,
+        url: Union[str, None] = None,
+        raw_html: Union[str, None] = None,
+        fields: Optional[Iterable[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> Article:
         """Extract the most likely article content from the html page
 
         Args:
             url (str): URL to pull and parse
             raw_html (str): String representation of the HTML page
+            fields (iterable): Names of the article properties to extract, e.g. `{"title", "cleaned_text"}`; only
+                the work needed for those is done and the other properties keep their default value. Defaults to
+                extracting everything
+            deadline (float): Number of seconds the extraction may take; once over, the stages left, the content
+                scoring and the image downloads are stopped and the article is returned as it is with
+                `article.deadline_exceeded` set. Defaults to no limit
         Returns:
-            Article: Representation of the article contents including other parsed and extracted metadata"""
+            Article: Representation of the article contents including other parsed and extracted metadata
+        Note:
+            The deadline is checked between the stages and the steps of the slow ones; a single step, such as the
+            download of the page or of an image (see `http_timeout`), is not interrupted"""
         if not url and not raw_html:
             raise ValueError("Either url or raw_html should be provided")
         if url is None and raw_html is None:
             raise ValueError("Either url or raw_html should be provided")
-        crawl_candidate = CrawlCandidate(self.config, url, raw_html)
+        crawl_candidate = CrawlCandidate(self.config, url, raw_html, fields, deadline)
         return self.__crawl(crawl_candidate)
 
+    async def aextract(
+        self,
+        url: Union[str, None] = None,
+        raw_html: Union[str, None] = None,
+        fields: Optional[Iterable[str]] = None,
+        executor=None,
+        deadline: Optional[float] = None,
+    ) -> Article:
+        """asyncio version of `extract`: the page is downloaded without blocking the event loop and the CPU bound
+        extraction is run in an executor
+
+        Args:
+            url (str): URL to pull and parse
+            raw_html (str): String representation of the HTML page
+            fields (iterable): Names of the article properties to extract; see `extract`
+            executor (concurrent.futures.Executor): Thread based executor to run the extraction in; defaults to the
+                default executor of the event loop
+            deadline (float): Number of seconds the extraction may take; see `extract`
+        Returns:
+            Article: Representation of the article contents including other parsed and extracted metadata
+        Note:
+            Requires the `httpx` package. Images downloaded during the extraction are fetched on the event loop
+            while the executor thread waits for them"""
+        if not url and not raw_html:
+            raise ValueError("Either url or raw_html should be provided")
+
+        loop = asyncio.get_running_loop()
+        if self.async_fetcher is None:
+            self.async_fetcher = AsyncNetworkFetcher(self.config)
+        self.async_fetcher.bind_loop(loop)
+
+        crawl_candidate = CrawlCandidate(self.config, url, raw_html, fields, deadline)
+        crawler = self._acquire_crawler(self.async_fetcher)
+        try:
+            parse_candidate = crawler.get_parse_candidate(crawl_candidate)
+            html = await crawler.aget_html(crawl_candidate, parse_candidate)
+            if html is None:
+                logger.warning("No raw_html is provided or could be fetched; continuing with an empty Article object")
+                return crawler.article
+
+            return await loop.run_in_executor(
+                executor,
+                crawler.process,
+                html,
+                parse_candidate.url,
+                parse_candidate.link_hash,
+                crawl_candidate.stages,
+                crawl_candidate.deadline,
+            )
+        finally:
+            self._release_crawler(crawler)
+
+    def extract_many(
+        self,
+        items: Iterable[BatchItem],
+        workers: Optional[int] = None,
+        ordered: bool = False,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """Extract many urls and / or html documents using a pool of worker processes
+
+        Args:
+            items (iterable): URLs to pull and parse, or dictionaries with a `url` and / or `raw_html` key
+            workers (int): The number of worker processes; defaults to the number of CPUs
+            ordered (bool): Yield the results in the order of `items` instead of as they finish
+            max_in_flight (int): The maximum number of items submitted but not yet yielded; defaults to twice the
+                number of workers
+        Returns:
+            iterator(BatchResult): One result per item holding either the article or the error raised
+        Note:
+            Each worker holds its own Goose instance built from this configuration. The returned articles do not
+            carry the lxml trees (`doc`, `raw_doc` and `top_node`) as these cannot leave the worker process
+        """
+        return iter_batch(self.config, items, workers=workers, ordered=ordered, max_in_flight=max_in_flight)
+
     def shutdown_network(self):
         """Close the network connection
 
@@ -130,13 +253,37 @@ class Goose:
         self.fetcher.close()
         self.fetcher = None
 
+    def _acquire_crawler(self, fetcher) -> Crawler:
+        """Get an idle crawler using the fetcher or build a new one when there is none"""
+        crawler = None
+        with self._crawlers_lock:
+            for i in range(len(self._crawlers) - 1, -1, -1):
+                if self._crawlers[i].fetcher is fetcher:
+                    crawler = self._crawlers.pop(i)
+                    break
+        if crawler is None:
+            return Crawler(self.config, fetcher)
+        # pick up any configuration change made since the crawler was last used
+        crawler.reset()
+        return crawler
+
+    def _release_crawler(self, crawler: Crawler):
+        """Give a crawler back once the extraction is done; it drops the reference to the extracted article"""
+        crawler.reset()
+        with self._crawlers_lock:
+            if len(self._crawlers) < MAX_IDLE_CRAWLERS:
+                self._crawlers.append(crawler)
+
     def __crawl(self, crawl_candidate: CrawlCandidate):
         """wrap the crawling functionality"""
 
         def crawler_wrapper(parser: str, parsers: List[str], crawl_candidate: CrawlCandidate):
             try:
-                crawler = Crawler(self.config, self.fetcher)
-                article = crawler.crawl(crawl_candidate)
+                crawler = self._acquire_crawler(self.fetcher)
+                try:
+                    article = crawler.crawl(crawl_candidate)
+                finally:
+                    self._release_crawler(crawler)
             except (UnicodeDecodeError, ValueError) as ex:
                 logger.error("Parser %s failed to parse the content", parser)
                 if parsers:
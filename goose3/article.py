@@ -47,9 +47,19 @@ class Article:
         self._schema = None
         self._doc = None
         self._raw_doc = None
+        self._raw_doc_loader = None
         self._publish_date = None
         self._publish_datetime_utc = None
         self._additional_data = {}
+        self._timings = {}
+        self._counters = {}
+        self._fingerprint = None
+        self._oversized = False
+        # monotonic time the extraction must be done by, see Goose.extract
+        self._deadline = None
+        self._deadline_exceeded = False
+        # content scores when they are not kept on the nodes, see Configuration.gravity_score_attributes
+        self._gravity_scores = None
 
     @property
     def title(self):
@@ -236,7 +246,12 @@ class Article:
         """etree: Original, uncleaned, and untouched lxml document to be processed
 
         Note:
-            Read only"""
+            Read only
+        Note:
+            When `Configuration.lazy_raw_doc` is set, the document is parsed from the `raw_html` on first access"""
+        if self._raw_doc is None and self._raw_doc_loader is not None:
+            self._raw_doc = self._raw_doc_loader()
+            self._raw_doc_loader = None
         return self._raw_doc
 
     @property
@@ -272,6 +287,51 @@ class Article:
             Read only"""
         return self._additional_data
 
+    @property
+    def timings(self):
+        """dict: The wall and CPU time, in seconds, spent in each stage of the extraction along with the number
+        of times the stage ran; empty unless `enable_instrumentation` is set
+
+        Note:
+            Read only"""
+        return self._timings
+
+    @property
+    def counters(self):
+        """dict: Counts of the work done during the extraction such as `xpath_evaluations` or `http_requests`;
+        empty unless `enable_instrumentation` is set
+
+        Note:
+            Read only"""
+        return self._counters
+
+    @property
+    def fingerprint(self):
+        """int: 64 bit SimHash of the cleaned text, see `goose3.dedup.SimHashIndex` to find near duplicates; `None`
+        unless `enable_fingerprint` is set or the `fingerprint` field is requested
+
+        Note:
+            Read only"""
+        return self._fingerprint
+
+    @property
+    def oversized(self):
+        """bool: Whether the document went over `max_html_bytes` or `max_dom_nodes` and was truncated or only had
+        its metadata extracted, see `Configuration.oversize_policy`
+
+        Note:
+            Read only"""
+        return self._oversized
+
+    @property
+    def deadline_exceeded(self):
+        """bool: Whether the `deadline` of the extraction passed before it was done; the stages left were not run
+        and the fields they set keep their default value
+
+        Note:
+            Read only"""
+        return self._deadline_exceeded
+
     @property
     def infos(self):
         """dict: The summation of all data available about the extracted article
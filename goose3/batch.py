@@ -0,0 +1,165 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from goose3.article import Article
+from goose3.configuration import Configuration
+
+BatchItem = Union[str, Dict[str, str]]
+
+# the warmed Goose instance owned by a worker process
+_WORKER_GOOSE = None
+
+
+class BatchResult:
+    """The outcome of extracting a single item of a batch
+
+    Args:
+        index (int): The position of the item in the input iterable
+        url (str): The url of the item, if one was provided
+        article (Article): The extracted article; `None` if the extraction failed
+        error (Exception): The exception raised while extracting the item; `None` on success
+    """
+
+    __slots__ = ["index", "url", "article", "error"]
+
+    def __init__(self, index: int, url: Optional[str], article: Optional[Article] = None, error=None):
+        self.index = index
+        self.url = url
+        self.article = article
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """bool: `True` if the item was extracted without error"""
+        return self.error is None
+
+    def __repr__(self):
+        return f"BatchResult(index={self.index} url={self.url} ok={self.ok})"
+
+
+def detach_article(article: Article) -> Article:
+    """Drop the lxml trees referenced by the article so that it can be pickled
+
+    Note:
+        `doc`, `raw_doc` and `top_node` are `None` on the returned article; `top_node_raw_html` is kept"""
+    article._doc = None
+    article._raw_doc = None
+    article._raw_doc_loader = None
+    article._top_node = None
+    article._gravity_scores = None
+    return article
+
+
+def normalize_item(item: BatchItem) -> Dict[str, Optional[str]]:
+    """Turn a batch item into the keyword arguments of `Goose.extract`
+
+    A string is considered to be a url; a dictionary may provide the `url` and / or `raw_html` keys"""
+    if isinstance(item, str):
+        return {"url": item, "raw_html": None}
+    if isinstance(item, dict):
+        return {"url": item.get("url"), "raw_html": item.get("raw_html")}
+    raise TypeError(f"Unknown batch item type: {type(item)}. Use a url or a dictionary.")
+
+
+def _portable_error(exc: Exception) -> Exception:
+    """Not every exception survives the trip back from the worker; fall back to a RuntimeError"""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+def _init_worker(config: Configuration):
+    global _WORKER_GOOSE
+    from goose3 import Goose
+
+    _WORKER_GOOSE = Goose(config)
+
+
+def _extract_item(index: int, item: BatchItem) -> BatchResult:
+    url = None
+    if isinstance(item, str):
+        url = item
+    elif isinstance(item, dict):
+        url = item.get("url")
+    try:
+        article = _WORKER_GOOSE.extract(**normalize_item(item))
+    except Exception as ex:
+        return BatchResult(index, url, error=_portable_error(ex))
+    return BatchResult(index, url, article=detach_article(article))
+
+
+def iter_batch(
+    config: Configuration,
+    items: Iterable[BatchItem],
+    workers: Optional[int] = None,
+    ordered: bool = False,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[BatchResult]:
+    """Extract the items using a pool of worker processes; see `Goose.extract_many`"""
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive number")
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError("max_in_flight must be a positive number")
+    workers = workers or os.cpu_count() or 1
+    window = max_in_flight or workers * 2
+
+    items_iter = enumerate(items)
+    pending = set()
+    finished: Dict[int, BatchResult] = {}
+    next_index = 0
+    exhausted = False
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,))
+    try:
+        while True:
+            # keep the window full; results waiting for their turn count against it
+            while not exhausted and len(pending) + len(finished) < window:
+                try:
+                    index, item = next(items_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(_extract_item, index, item))
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if ordered:
+                    finished[result.index] = result
+                else:
+                    yield result
+
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,320 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import abc
+import copy
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Set
+
+from goose3.article import Article
+from goose3.batch import detach_article
+from goose3.configuration import Configuration
+
+# configuration settings that have no bearing on the extracted article
+_CONFIG_KEY_IGNORED = {
+    "_available_parsers",
+    "_browser_user_agent",
+    "_http_timeout",
+    "_http_auth",
+    "_http_proxies",
+    "_http_headers",
+    "_local_storage_path",
+    "_strict",
+    "_log_level",
+    "_imagemagick_convert_path",
+    "_imagemagick_identify_path",
+    "_lazy_raw_doc",
+    "_enable_instrumentation",
+    "_result_cache",
+}
+
+
+def config_fingerprint(config: Configuration) -> str:
+    """Hash of the configuration settings that change the outcome of an extraction"""
+    settings = sorted((k, repr(v)) for k, v in vars(config).items() if k not in _CONFIG_KEY_IGNORED)
+    return hashlib.blake2b(repr(settings).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cache_key(
+    config: Configuration, raw_html: str, url: Optional[str] = None, stages: Optional[Iterable[str]] = None
+) -> str:
+    """Build the result cache key of an extraction
+
+    Args:
+        config (Configuration): The configuration used for the extraction
+        raw_html (str): The html extracted
+        url (str): The url the html comes from, as it ends up in the article (final_url, domain, ...)
+        stages (iterable): The processing stages run; `None` for all of them
+    Returns:
+        str: The key"""
+    html = raw_html.encode("utf-8") if isinstance(raw_html, str) else raw_html
+    content = hashlib.blake2b(html, digest_size=16).hexdigest()
+    extra = repr((url, sorted(stages) if stages is not None else None))
+    extra = hashlib.blake2b(extra.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{content}.{config_fingerprint(config)}.{extra}"
+
+
+def dump_article(article: Article) -> bytes:
+    """Serialize the article for storage in a cache; the lxml trees are left out, see `detach_article`"""
+    article = detach_article(copy.copy(article))
+    article._timings = {}
+    article._counters = {}
+    return pickle.dumps(article, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_article(data: bytes) -> Article:
+    return pickle.loads(data)
+
+
+class CacheStats:
+    """Hit and miss statistics of a result cache"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """float: The ratio of lookups that were found in the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self):
+        return f"CacheStats(hits={self.hits} misses={self.misses} stores={self.stores} evictions={self.evictions})"
+
+
+class ResultCache(abc.ABC):
+    """Base class of the extraction result caches; values are the serialized articles
+
+    Note:
+        Sub classes implement `_get`, `_set` and `clear`; the statistics are updated under `_lock`, which sub
+        classes may share to guard their own state"""
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the value stored for the key; `None` if there is none"""
+        value = self._get(key)
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes) -> bool:
+        """Store the value for the key
+
+        Returns:
+            bool: Whether the value was stored"""
+        stored = self._set(key, value)
+        if stored:
+            with self._lock:
+                self.stats.stores += 1
+        return stored
+
+    def get_article(self, key: str) -> Optional[Article]:
+        """Get the article stored for the key; `None` if there is none"""
+        data = self.get(key)
+        return load_article(data) if data is not None else None
+
+    def set_article(self, key: str, article: Article) -> bool:
+        """Store the article for the key; see `set`"""
+        return self.set(key, dump_article(article))
+
+    @abc.abstractmethod
+    def clear(self):
+        """Remove all the values stored"""
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        """Get the value stored for the key; `None` if there is none"""
+
+    @abc.abstractmethod
+    def _set(self, key: str, value: bytes) -> bool:
+        """Store the value for the key and tell whether it was stored"""
+
+
+class MemoryCache(ResultCache):
+    """In memory least recently used cache bound by the total size of the stored values
+
+    Args:
+        max_bytes (int): The maximum total size of the values kept; defaults to 64 MiB
+
+    Note:
+        Each process has its own; copying it (e.g. to the worker processes of `extract_many`) yields an empty cache
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getstate__(self):
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_bytes"])
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def _get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def _set(self, key, value):
+        if len(value) > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._items[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+                self.stats.evictions += 1
+        return True
+
+
+class SQLiteCache(ResultCache):
+    """On disk cache stored in a sqlite database; processes using the same path share the cache
+
+    Args:
+        path (str): The database file
+        max_age (float): Number of seconds after which an entry is considered stale; defaults to never
+
+    Note:
+        Each thread uses its own connection to the database"""
+
+    def __init__(self, path: str, max_age: Optional[float] = None):
+        super().__init__()
+        self.path = path
+        self.max_age = max_age
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB, created REAL)")
+
+    def __getstate__(self):
+        return {"path": self.path, "max_age": self.max_age}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["max_age"])
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def clear(self):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM results")
+
+    def _get(self, key):
+        row = self._connection().execute("SELECT value, created FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if self.max_age is not None and time.time() - row[1] > self.max_age:
+            return None
+        return row[0]
+
+    def _set(self, key, value):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)", (key, value, time.time())
+            )
+        return True
+
+
+class TieredCache(ResultCache):
+    """Look up the caches in order, e.g. a MemoryCache in front of a SQLiteCache; values found in a lower tier are
+    copied to the tiers above it
+
+    Args:
+        tiers (ResultCache): The caches from the fastest to the slowest"""
+
+    def __init__(self, *tiers: ResultCache):
+        super().__init__()
+        self.tiers = list(tiers)
+
+    def clear(self):
+        for tier in self.tiers:
+            tier.clear()
+
+    def _get(self, key):
+        missed: Set[int] = set()
+        for i, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for j in missed:
+                    self.tiers[j].set(key, value)
+                return value
+            missed.add(i)
+        return None
+
+    def _set(self, key, value):
+        stored = [tier.set(key, value) for tier in self.tiers]
+        return any(stored)
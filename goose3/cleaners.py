@@ -20,8 +20,65 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
+import re
+from copy import deepcopy
+
+from lxml import etree
+
 from goose3.utils import ReplaceSequence
 
+# tags making a div or a span hold blocks rather than a paragraph
+BLOCK_TAGS = frozenset(["a", "blockquote", "dl", "div", "img", "ol", "p", "pre", "table", "ul"])
+
+# distinct id, class and name values remembered by each attribute classifier
+CLASSIFIER_CACHE_SIZE = 8192
+
+
+class AttributeClassifier:
+    """Tell whether an id, class or name value marks a node as content to be removed
+
+    The values repeat a lot within a page and across the pages of a site, each distinct value is only
+    matched against the patterns once and the answer is kept in a bounded LRU cache. `rank` serves the
+    single pass cleaner, `test` the rule by rule one"""
+
+    def __init__(self, patterns, cache_size=CLASSIFIER_CACHE_SIZE):
+        # ids and classes are checked against all the patterns, names only against the first one
+        self.id_class_re = re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+        self.name_re = re.compile(patterns[0], re.IGNORECASE)
+
+        # the rules in the order the standard cleaner applies them, after the scripts, styles and comments
+        self.rules = [("id", self.name_re), ("class", self.name_re), ("name", self.name_re)]
+        for pattern in patterns[1:]:
+            regex = re.compile(pattern, re.IGNORECASE)
+            self.rules.extend([("id", regex), ("class", regex)])
+
+        self.rank = functools.lru_cache(maxsize=cache_size)(self._rank)
+        self.test = functools.lru_cache(maxsize=cache_size)(self._test)
+
+    def _rank(self, attr, value):
+        """Position of the first rule matching the value of the attribute, None if no rule does"""
+        if not (self.name_re if attr == "name" else self.id_class_re).search(value):
+            return None
+        for rank, (rule_attr, regex) in enumerate(self.rules, start=3):
+            if rule_attr == attr and regex.search(value):
+                return rank
+        return None
+
+    def _test(self, pattern, value):
+        """Whether the pattern matches the value, the same as the EXSLT `re:test(value, pattern, 'i')`"""
+        return re.search(pattern, value, re.IGNORECASE) is not None
+
+    def cache_info(self):
+        """The hits, misses and size of the LRU cache of `rank`"""
+        return self.rank.cache_info()
+
+
+@functools.lru_cache(maxsize=32)
+def get_attribute_classifier(patterns):
+    """The classifier of a tuple of patterns, shared by all the cleaners and documents using them"""
+    return AttributeClassifier(patterns)
+
 
 class DocumentCleaner:
     def __init__(self, config, article):
@@ -35,7 +92,7 @@ class DocumentCleaner:
         self.article = article
 
         # nodes to remove regexp
-        self.remove_nodes_re = (
+        self.builtin_remove_nodes_re = (
             "^side$|combx|retweet|mediaarticlerelated|menucontainer|"
             "navbar|storytopbar-bucket|utility-bar|inline-share-tools"
             "|comment|PopularQuestions|contact|foot|footer|Footer|footnote"
@@ -50,9 +107,6 @@ class DocumentCleaner:
             "|legende|ajoutVideo|timestamp|js_replies|disclaim"
         )
         self.regexp_namespace = "http://exslt.org/regular-expressions"
-        self.nauthy_ids_re = f"//*[re:test(@id, '{self.remove_nodes_re}', 'i')]"
-        self.nauthy_classes_re = f"//*[re:test(@class, '{self.remove_nodes_re}', 'i')]"
-        self.nauthy_names_re = f"//*[re:test(@name, '{self.remove_nodes_re}', 'i')]"
         # self.div_to_p_re = r"<(a|blockquote|dl|div|img|ol|p|pre|table|ul)"
         self.caption_re = "^caption$"
         self.google_re = " google "
@@ -61,6 +115,32 @@ class DocumentCleaner:
         self.facebook_braodcasting_re = "facebook-broadcasting"
         self.twitter_re = "[^-]twitter"
         self.tablines_replacements = ReplaceSequence().create("\n", "\n\n").append("\t").append("^\\s+$")
+        self.build_rules()
+
+    def reset(self, article):
+        """Bind the cleaner to a new article so that it can be reused"""
+        self.parser = self.config.get_parser()
+        self.article = article
+        self.build_rules()
+
+    def build_rules(self):
+        """Build the removal rules from the built in patterns and the ones of the configuration"""
+        # the configured patterns join the built in ones so that they do not add a pass over the document
+        self.remove_nodes_re = "|".join([self.builtin_remove_nodes_re, *self.config.remove_nodes_patterns])
+        # the selectors are scoped to the node being cleaned so that a node can be cleaned in place
+        self.nauthy_ids_re = f"descendant-or-self::*[re:test(@id, '{self.remove_nodes_re}', 'i')]"
+        self.nauthy_classes_re = f"descendant-or-self::*[re:test(@class, '{self.remove_nodes_re}', 'i')]"
+        self.nauthy_names_re = f"descendant-or-self::*[re:test(@name, '{self.remove_nodes_re}', 'i')]"
+        patterns = (
+            self.remove_nodes_re,
+            self.caption_re,
+            self.google_re,
+            self.entries_re,
+            self.facebook_re,
+            self.facebook_braodcasting_re,
+            self.twitter_re,
+        )
+        self.classifier = get_attribute_classifier(patterns)
 
     def clean(self, doc_to_clean):
         doc_to_clean = self.clean_body_classes(doc_to_clean)
@@ -124,38 +204,36 @@ class DocumentCleaner:
             self.parser.remove(item)
 
         # remove comments
-        comments = self.parser.get_comments(doc)
+        comments = self.parser.xpath_re(doc, "descendant-or-self::comment()")
         for item in comments:
             self.parser.remove(item)
 
         return doc
 
     def clean_bad_tags(self, doc):
-        # ids
-        naughty_list = self.parser.xpath_re(doc, self.nauthy_ids_re)
-        for node in naughty_list:
-            self.parser.remove(node)
-
-        # class
-        naughty_classes = self.parser.xpath_re(doc, self.nauthy_classes_re)
-        for node in naughty_classes:
-            self.parser.remove(node)
-
-        # name
-        naughty_names = self.parser.xpath_re(doc, self.nauthy_names_re)
-        for node in naughty_names:
-            self.parser.remove(node)
-
+        for attr in ["id", "class", "name"]:
+            for node in self.naughty_nodes(doc, attr, self.remove_nodes_re):
+                self.parser.remove(node)
         return doc
 
     def remove_nodes_regex(self, doc, pattern):
         for selector in ["id", "class"]:
-            reg = f"//*[re:test(@{selector}, '{pattern}', 'i')]"
-            naughty_list = self.parser.xpath_re(doc, reg)
-            for node in naughty_list:
+            for node in self.naughty_nodes(doc, selector, pattern):
                 self.parser.remove(node)
         return doc
 
+    def naughty_nodes(self, doc, attr, pattern):
+        """The nodes of which the attribute matches the pattern, in document order; the same as selecting
+        `re:test(@attr, pattern, 'i')` while each distinct value is only matched once"""
+        # a missing attribute is tested as an empty string, the same as the EXSLT regular expressions do
+        if self.classifier.test(pattern, ""):
+            selector = "descendant-or-self::*"
+        else:
+            selector = f"descendant-or-self::*[@{attr}]"
+        return [
+            node for node in self.parser.xpath_re(doc, selector) if self.classifier.test(pattern, node.get(attr, ""))
+        ]
+
     def clean_para_spans(self, doc):
         spans = self.parser.css_select(doc, "p span")
         for item in spans:
@@ -165,81 +243,105 @@ class DocumentCleaner:
     def get_flushed_buffer(self, replacement_text):
         return self.parser.text_to_para(replacement_text)
 
+    def get_flushed_nodes(self, replacement_nodes):
+        return self.parser.nodes_to_para(replacement_nodes)
+
     def get_replacement_nodes(self, div):
-        replacement_text = []
+        replacement_nodes = []
         nodes_to_return = []
         nodes_to_remove = []
         childs = self.parser.child_nodes_with_text(div)
+        # the text of the div is in the first text node
+        div.text = None
 
-        for kid in childs:
+        for idx, kid in enumerate(childs):
             # node is a p
             # and already have some replacement text
-            if self.parser.get_tag(kid) == "p" and len(replacement_text) > 0:
-                new_node = self.get_flushed_buffer("".join(replacement_text))
+            if self.parser.get_tag(kid) == "p" and len(replacement_nodes) > 0:
+                new_node = self.get_flushed_nodes(replacement_nodes)
                 nodes_to_return.append(new_node)
-                replacement_text = []
+                replacement_nodes = []
                 nodes_to_return.append(kid)
             # node is a text node
             elif self.parser.is_text_node(kid):
-                kid_text_node = kid
                 kid_text = self.parser.get_text(kid)
                 replace_text = self.tablines_replacements.replace_all(kid_text)
                 if (len(replace_text)) > 1:
-                    previous_sibling_node = self.parser.previous_sibling(kid_text_node)
-                    while (
-                        previous_sibling_node is not None
-                        and self.parser.get_tag(previous_sibling_node) == "a"
-                        and self.parser.get_attribute(previous_sibling_node, "grv-usedalready") != "yes"
-                    ):
-                        outer = " " + self.parser.outer_html(previous_sibling_node) + " "
-                        replacement_text.append(outer)
+                    # the links next to the text go in the paragraph with it, as copies:
+                    # the links themselves are emptied and stay where they are
+                    prev_idx = idx - 1
+                    while prev_idx >= 0 and self.is_unused_link(childs[prev_idx]):
+                        previous_sibling_node = childs[prev_idx]
+                        replacement_nodes.append(self.copy_link(previous_sibling_node))
                         nodes_to_remove.append(previous_sibling_node)
                         self.parser.set_attribute(previous_sibling_node, attr="grv-usedalready", value="yes")
-                        prev = self.parser.previous_sibling(previous_sibling_node)
-                        previous_sibling_node = prev if prev is not None else None
+                        prev_idx -= 1
                     # append replace_text
-                    replacement_text.append(replace_text)
-                    #
-                    next_sibling_node = self.parser.next_sibling(kid_text_node)
-                    while (
-                        next_sibling_node is not None
-                        and self.parser.get_tag(next_sibling_node) == "a"
-                        and self.parser.get_attribute(next_sibling_node, "grv-usedalready") != "yes"
-                    ):
-                        outer = " " + self.parser.outer_html(next_sibling_node) + " "
-                        replacement_text.append(outer)
+                    replacement_nodes.append(replace_text)
+                    # only the first of the following links
+                    if idx + 1 < len(childs) and self.is_unused_link(childs[idx + 1]):
+                        next_sibling_node = childs[idx + 1]
+                        replacement_nodes.append(self.copy_link(next_sibling_node))
                         nodes_to_remove.append(next_sibling_node)
                         self.parser.set_attribute(next_sibling_node, attr="grv-usedalready", value="yes")
-                        next_sib = self.parser.next_sibling(next_sibling_node)
-                        previous_sibling_node = next_sib if next_sib is not None else None
 
             # otherwise
             else:
                 nodes_to_return.append(kid)
 
         # flush out anything still remaining
-        if len(replacement_text) > 0:
-            new_node = self.get_flushed_buffer("".join(replacement_text))
+        if len(replacement_nodes) > 0:
+            new_node = self.get_flushed_nodes(replacement_nodes)
             nodes_to_return.append(new_node)
-            replacement_text = []
+            replacement_nodes = []
 
         for node in nodes_to_remove:
-            self.parser.remove(node)
+            # the tail of a link goes to the node before it, the same as `Parser.remove` in a div holding
+            # the text nodes
+            idx = childs.index(node)
+            if node.tail:
+                if idx == 0:
+                    div.text = (div.text or "") + " " + node.tail
+                else:
+                    prev = childs[idx - 1]
+                    prev.tail = (prev.tail or "") + " " + node.tail
+            node.clear()
+            del childs[idx]
 
         return nodes_to_return
 
+    def is_unused_link(self, node):
+        return self.parser.get_tag(node) == "a" and self.parser.get_attribute(node, "grv-usedalready") != "yes"
+
+    def copy_link(self, node):
+        copy = deepcopy(node)
+        copy.tail = None
+        return copy
+
     def replace_with_para(self, div):
         self.parser.replace_tag(div, "p")
 
+    def block_holders(self, doc):
+        """The nodes of the document with one of the `BLOCK_TAGS` among their descendants
+
+        Computed bottom up for all the nodes at once instead of selecting the block tags under each node"""
+        holders = set()
+        # in reverse document order the descendants of a node all come before it
+        for node in reversed(list(doc.iter())):
+            if node is not doc and (node.tag in BLOCK_TAGS or node in holders):
+                holders.add(node.getparent())
+        return holders
+
     def div_to_para(self, doc, dom_type):
         bad_divs = 0
         else_divs = 0
         divs = self.parser.get_elements_by_tag(doc, tag=dom_type)
-        tags = ["a", "blockquote", "dl", "div", "img", "ol", "p", "pre", "table", "ul"]
+        # the nodes are converted in document order and a conversion only changes the children of the node
+        # converted, so the block descendants of the nodes still to convert are the ones found beforehand
+        holders = self.block_holders(doc)
 
         for div in divs:
-            items = self.parser.get_elements_by_tags(div, tags)
-            if div is not None and len(items) == 0:
+            if div is not None and div not in holders:
                 self.replace_with_para(div)
                 bad_divs += 1
             elif div is not None:
@@ -257,3 +359,102 @@ class DocumentCleaner:
 
 class StandardDocumentCleaner(DocumentCleaner):
     pass
+
+
+class SinglePassDocumentCleaner(DocumentCleaner):
+    """Document cleaner giving the same result as the `StandardDocumentCleaner` while walking the document once
+    instead of running an XPath / CSS selection per rule
+
+    The walk decides what happens to each node (attributes to clear, tag to drop, node to remove) using
+    precompiled regular expressions; the decisions are then applied in the order of the standard cleaner."""
+
+    def clean(self, doc_to_clean):
+        doc_to_clean = self.clean_single_pass(doc_to_clean)
+        doc_to_clean = self.div_to_para(doc_to_clean, "div")
+        doc_to_clean = self.div_to_para(doc_to_clean, "span")
+        return doc_to_clean
+
+    def naughty_rank(self, node, skip=()):
+        """Position of the first rule marking the node as content to be removed, None if no rule does"""
+        rank = None
+        for attr in ("id", "class", "name"):
+            if attr in skip:
+                continue
+            # a missing attribute is tested as an empty string, the same as the EXSLT regular expressions do
+            attr_rank = self.classifier.rank(attr, node.get(attr, ""))
+            if attr_rank is not None and (rank is None or attr_rank < rank):
+                rank = attr_rank
+        return rank
+
+    def clean_single_pass(self, doc):
+        """Same as the steps of the `StandardDocumentCleaner.clean` from `clean_body_classes` to
+        `clean_para_spans`"""
+        drops = {"em": [], "small": [], "dropcap": []}
+        removes = []
+        para_spans = []
+        body_seen = False
+
+        # (node, inside a paragraph)
+        stack = [(doc, False)]
+        while stack:
+            node, in_para = stack.pop()
+            tag = node.tag
+            if tag is etree.Comment:
+                removes.append((2, node))
+                continue
+            if not isinstance(tag, str):
+                continue
+
+            is_root = node is doc
+            skip = ()
+            dropped = False
+            if not is_root:
+                if tag == "body" and not body_seen:
+                    body_seen = True
+                    self.parser.del_attribute(node, attr="class")
+                elif tag == "article":
+                    for attr in ["id", "name", "class"]:
+                        self.parser.del_attribute(node, attr=attr)
+                    skip = ("id", "name", "class")
+                elif tag in ("em", "small") and next(node.iter("img"), None) is None:
+                    drops[tag].append(node)
+                    dropped = True
+                elif tag in ("script", "style"):
+                    removes.append((0 if tag == "script" else 1, node))
+                    continue
+            if tag == "span" and {"dropcap", "drop_cap"}.intersection((node.get("class") or "").split()):
+                drops["dropcap"].append(node)
+                dropped = True
+
+            # dropped tags are gone by the time the naughty nodes are looked for; their children are not
+            rank = None if dropped else self.naughty_rank(node, skip)
+            if rank is not None:
+                removes.append((rank, node))
+                if not is_root:
+                    continue
+                if node.getparent() is not None:
+                    # removing the root leaves nothing else to clean
+                    self._apply(drops, removes, [])
+                    return doc
+
+            if tag == "span" and in_para and not dropped:
+                para_spans.append(node)
+
+            in_para = in_para or tag == "p"
+            # reversed so that the nodes come off the stack in document order
+            for child in reversed(node):
+                stack.append((child, in_para))
+
+        self._apply(drops, removes, para_spans)
+        return doc
+
+    def _apply(self, drops, removes, para_spans):
+        for tag in ["em", "small", "dropcap"]:
+            for node in drops[tag]:
+                self.parser.drop_tag(node)
+        # nodes are found in document order, they are removed rule after rule as the standard cleaner does:
+        # removing a node appends its tail to its previous sibling, so the order shows in the whitespace
+        for _, node in sorted(removes, key=lambda item: item[0]):
+            self.parser.remove(node)
+        for node in para_spans:
+            self.parser.drop_tag(node)
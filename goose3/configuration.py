@@ -21,11 +21,15 @@ limitations under the License.
 """
 
 import os
+import re
 import tempfile
-from typing import Any, List, Type, Union
+from typing import Any, List, Optional, Tuple, Type, Union
 
+from goose3.cleaners import DocumentCleaner, StandardDocumentCleaner
+from goose3.extractors.content import ContentExtractor, StandardContentExtractor
 from goose3.parsers import Parser, ParserSoup
 from goose3.text import StopWords
+from goose3.utils import FINGERPRINT_ALGORITHMS
 from goose3.version import __version__
 
 AVAILABLE_PARSERS = {
@@ -33,6 +37,9 @@ AVAILABLE_PARSERS = {
     "soup": ParserSoup,
 }
 
+# what to do with the documents over the size limits
+OVERSIZE_POLICIES = ("reject", "truncate", "metadata")
+
 
 class ArticleContextPattern:
     """Help ensure correctly generated article context patterns
@@ -157,6 +164,14 @@ KNOWN_AUTHOR_PATTERNS = [
 ]
 
 
+def _size_limit(val, name):
+    if val is None:
+        return None
+    if isinstance(val, bool) or int(val) != val or val < 1:
+        raise ValueError(f"{name} must be a positive integer or None")
+    return int(val)
+
+
 class Configuration:
     def __init__(self):
         # parser information
@@ -197,6 +212,36 @@ class Configuration:
         self._parse_headers = True
         self._keep_footnotes = True
 
+        # memory / performance trade-offs
+        self._lazy_raw_doc = False
+
+        # instrumentation
+        self._enable_instrumentation = False
+
+        # extraction results cache
+        self._result_cache = None
+
+        # hash function of the link_hash and the local image file names
+        self._fingerprint_algorithm = "blake2b"
+
+        # near duplicate detection
+        self._enable_fingerprint = False
+
+        # document cleaner implementation
+        self._document_cleaner_class = StandardDocumentCleaner
+        self._remove_nodes_patterns = ()
+
+        # content scoring implementation
+        self._content_extractor_class = StandardContentExtractor
+
+        # where the content scores are kept
+        self._gravity_score_attributes = True
+
+        # limits of the size of the documents
+        self._max_html_bytes = None
+        self._max_dom_nodes = None
+        self._oversize_policy = "reject"
+
     @property
     def known_context_patterns(self) -> list:
         """list: The context patterns to search to find the likely article content
@@ -602,6 +647,214 @@ class Configuration:
         """set if headers should be parsed"""
         self._keep_footnotes = bool(val)
 
+    @property
+    def lazy_raw_doc(self) -> bool:
+        """bool: Do not keep a pristine copy of the document while extracting; `article.raw_doc` is instead parsed
+        again from the `raw_html` the first time it is accessed
+
+        Note:
+            Defaults to `False`
+        Note:
+            Saves a full copy of the document per article, at the cost of a second parse when `raw_doc` is used,
+            such as when image fetching is enabled"""
+        return self._lazy_raw_doc
+
+    @lazy_raw_doc.setter
+    def lazy_raw_doc(self, val: bool):
+        """set the lazy_raw_doc property"""
+        self._lazy_raw_doc = bool(val)
+
+    @property
+    def enable_instrumentation(self) -> bool:
+        """bool: Record the time spent in each stage of the extraction along with counters such as the number of
+        XPath evaluations and HTTP requests; see `article.timings` and `article.counters`
+
+        Note:
+            Defaults to `False`
+        Note:
+            The totals of all instrumented extractions are kept in `goose3.instrumentation.GLOBAL_STATS`"""
+        return self._enable_instrumentation
+
+    @enable_instrumentation.setter
+    def enable_instrumentation(self, val: bool):
+        """set the enable_instrumentation property"""
+        self._enable_instrumentation = bool(val)
+
+    @property
+    def result_cache(self):
+        """ResultCache: Cache of the extracted articles, keyed on the html, the url and the configuration, e.g. a
+        `goose3.cache.MemoryCache`, `goose3.cache.SQLiteCache` or a `goose3.cache.TieredCache` of both
+
+        Note:
+            Defaults to `None`, i.e. no caching
+        Note:
+            Articles returned from the cache do not hold the `doc` and `top_node` trees; `raw_doc` is parsed again
+            on first access"""
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, val):
+        """set the result_cache property"""
+        self._result_cache = val
+
+    @property
+    def fingerprint_algorithm(self) -> str:
+        """str: The hash function used for the `article.link_hash` and the names of the downloaded image files;
+        one of `blake2b` or `fnv_1a`
+
+        Note:
+            Defaults to `blake2b`; use `fnv_1a` to get the values of goose3 3.1.21 and earlier"""
+        return self._fingerprint_algorithm
+
+    @fingerprint_algorithm.setter
+    def fingerprint_algorithm(self, val: str):
+        """set the fingerprint_algorithm property"""
+        if val not in FINGERPRINT_ALGORITHMS:
+            raise ValueError(f"{val} is not a known fingerprint algorithm; use one of {list(FINGERPRINT_ALGORITHMS)}")
+        self._fingerprint_algorithm = val
+
+    @property
+    def enable_fingerprint(self) -> bool:
+        """bool: Compute `article.fingerprint`, a SimHash of the cleaned text, to find near duplicate articles
+
+        Note:
+            Defaults to `False`
+        Note:
+            Installing `numpy` speeds up the computation"""
+        return self._enable_fingerprint
+
+    @enable_fingerprint.setter
+    def enable_fingerprint(self, val: bool):
+        """set the enable_fingerprint property"""
+        self._enable_fingerprint = bool(val)
+
+    @property
+    def document_cleaner_class(self) -> Type[DocumentCleaner]:
+        """DocumentCleaner: The class used to clean the document before looking for the article content
+
+        Note:
+            Defaults to `StandardDocumentCleaner`
+        Note:
+            `goose3.cleaners.SinglePassDocumentCleaner` gives the same result in a single walk of the document
+            instead of one selection per cleaning rule"""
+        return self._document_cleaner_class
+
+    @document_cleaner_class.setter
+    def document_cleaner_class(self, val):
+        """set the document_cleaner_class property"""
+        if not isinstance(val, type) or not issubclass(val, DocumentCleaner):
+            raise ValueError(f"{val} must be a subclass of DocumentCleaner")
+        self._document_cleaner_class = val
+
+    @property
+    def remove_nodes_patterns(self) -> Tuple[str, ...]:
+        """tuple: Regular expressions matched against the id, class and name of the nodes, in addition to the
+        built in ones, to remove the nodes from the document before looking for the article content
+
+        Note:
+            Defaults to `()`
+        Note:
+            The patterns are matched ignoring the case, e.g. `^newsletter-signup$` or `related-(posts|links)`;
+            set the property to change them, it checks them"""
+        return self._remove_nodes_patterns
+
+    @remove_nodes_patterns.setter
+    def remove_nodes_patterns(self, val: Union[str, List[str]]):
+        """set the remove_nodes_patterns property"""
+        patterns = [val] if isinstance(val, str) else list(val)
+        for pattern in patterns:
+            if not isinstance(pattern, str) or "'" in pattern:
+                raise ValueError(f"{pattern!r} must be a string without single quotes")
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"{pattern!r} is not a valid regular expression: {e}") from e
+        self._remove_nodes_patterns = tuple(patterns)
+
+    @property
+    def content_extractor_class(self) -> Type[ContentExtractor]:
+        """ContentExtractor: The class used to score the nodes of the document, find the article content and clean
+        it up
+
+        Note:
+            Defaults to `StandardContentExtractor`
+        Note:
+            `goose3.extractors.content.VectorizedContentExtractor` finds the same content scoring all the nodes at
+            once with `numpy`; `goose3.extractors.content.DensityContentExtractor` scores the nodes on the density
+            of their text and links, without stop words, for languages without a stop words list"""
+        return self._content_extractor_class
+
+    @content_extractor_class.setter
+    def content_extractor_class(self, val):
+        """set the content_extractor_class property"""
+        if not isinstance(val, type) or not issubclass(val, ContentExtractor):
+            raise ValueError(f"{val} must be a subclass of ContentExtractor")
+        self._content_extractor_class = val
+
+    @property
+    def gravity_score_attributes(self) -> bool:
+        """bool: Keep the content scores as `gravityScore` and `gravityNodes` attributes of the scored nodes;
+        otherwise they are kept in a table aside of the document
+
+        Note:
+            Defaults to `True`
+        Note:
+            Without the attributes the scoring does not parse and write strings back for every update and the
+            attributes do not end up in `article.top_node_raw_html` or in `article.top_node`"""
+        return self._gravity_score_attributes
+
+    @gravity_score_attributes.setter
+    def gravity_score_attributes(self, val: bool):
+        """set the gravity_score_attributes property"""
+        self._gravity_score_attributes = bool(val)
+
+    @property
+    def max_html_bytes(self) -> Optional[int]:
+        """int: The largest html, in bytes, processed as is; larger ones are handled following `oversize_policy`
+
+        Note:
+            Defaults to `None`, no limit"""
+        return self._max_html_bytes
+
+    @max_html_bytes.setter
+    def max_html_bytes(self, val: Optional[int]):
+        """set the max_html_bytes property"""
+        self._max_html_bytes = _size_limit(val, "max_html_bytes")
+
+    @property
+    def max_dom_nodes(self) -> Optional[int]:
+        """int: The largest number of nodes of the parsed document processed as is; larger documents are handled
+        following `oversize_policy`
+
+        Note:
+            Defaults to `None`, no limit"""
+        return self._max_dom_nodes
+
+    @max_dom_nodes.setter
+    def max_dom_nodes(self, val: Optional[int]):
+        """set the max_dom_nodes property"""
+        self._max_dom_nodes = _size_limit(val, "max_dom_nodes")
+
+    @property
+    def oversize_policy(self) -> str:
+        """str: What to do with the documents over `max_html_bytes` or `max_dom_nodes`: `reject` them raising a
+        `goose3.exceptions.DocumentTooLargeError`, `truncate` them to the limit before extracting them, or only
+        extract the `metadata` of the truncated document and leave the content aside
+
+        Note:
+            Defaults to `reject`
+        Note:
+            The html is cut before the last tag starting within the limit and the document after its first
+            `max_dom_nodes` nodes; `article.oversized` tells the documents that went over"""
+        return self._oversize_policy
+
+    @oversize_policy.setter
+    def oversize_policy(self, val: str):
+        """set the oversize_policy property"""
+        if val not in OVERSIZE_POLICIES:
+            raise ValueError(f"{val} is not a known oversize policy; use one of {list(OVERSIZE_POLICIES)}")
+        self._oversize_policy = val
+
     def get_parser(self) -> Union[Parser, ParserSoup, Any]:
         """Retrieve the current parser class to use for extraction
 
@@ -23,7 +23,11 @@ limitations under the License.
 import glob
 import logging
 import os
+import time
+from contextlib import contextmanager, nullcontext
 from copy import deepcopy
+from functools import partial
+from typing import Iterable, Optional, Set
 
 import dateutil.parser  # type: ignore
 from dateutil.tz import tzutc  # type: ignore
@@ -32,10 +36,11 @@ from langdetect.lang_detect_exception import LangDetectException  # type: ignore
 from lxml import etree  # type: ignore
 
 from goose3.article import Article
-from goose3.cleaners import StandardDocumentCleaner
+from goose3.cache import cache_key
 from goose3.configuration import Configuration
+from goose3.dedup import text_fingerprint
+from goose3.exceptions import DeadlineExceeded, DocumentTooLargeError
 from goose3.extractors.authors import AuthorsExtractor
-from goose3.extractors.content import StandardContentExtractor
 from goose3.extractors.images import ImageExtractor
 from goose3.extractors.links import LinksExtractor
 from goose3.extractors.metas import MetasExtractor
@@ -46,21 +51,120 @@ from goose3.extractors.tags import TagsExtractor
 from goose3.extractors.title import TitleExtractor
 from goose3.extractors.tweets import TweetsExtractor
 from goose3.extractors.videos import VideoExtractor
-from goose3.network import NetworkFetcher
+from goose3.instrumentation import GLOBAL_STATS, Recorder
+from goose3.network import AsyncNetworkFetcher, NetworkFetcher
 from goose3.outputformatters import StandardOutputFormatter
 from goose3.text import get_encodings_from_content
 from goose3.utils import ParsingCandidate, RawHelper, URLHelper
 
 logger = logging.getLogger(__name__)
 
+# stand in for the stage timer when instrumentation is disabled
+_NO_STAGE = nullcontext()
+
+# the stages of the article processing along with the stages they rely on
+STAGE_DEPENDENCIES = {
+    "opengraph": (),
+    "schema": (),
+    "final_url": ("opengraph", "schema"),
+    "metas": ("final_url",),
+    "publish_date": ("opengraph", "schema", "metas"),
+    "tags": (),
+    "authors": ("schema",),
+    "title": ("opengraph", "schema", "metas"),
+    "language": ("metas",),
+    "content": ("metas", "language"),
+    "links": ("content",),
+    "tweets": ("content",),
+    "movies": ("content",),
+    "top_image": ("content", "opengraph", "schema", "metas"),
+    # the tweets extractor strips the scores off the tweets in the top node
+    "top_node_raw_html": ("content", "tweets"),
+    "cleaned_text": ("content", "language", "tweets"),
+    "fingerprint": ("cleaned_text", "language"),
+}
+
+# the stage setting each of the article fields; `None` for the fields always set
+FIELD_STAGES = {
+    "title": "title",
+    "cleaned_text": "cleaned_text",
+    "meta_description": "metas",
+    "meta_lang": "language",
+    "meta_favicon": "metas",
+    "meta_keywords": "metas",
+    "meta_encoding": "metas",
+    "canonical_link": "metas",
+    "domain": "metas",
+    "top_node": "cleaned_text",
+    "top_node_raw_html": "top_node_raw_html",
+    "top_image": "top_image",
+    "tags": "tags",
+    "opengraph": "opengraph",
+    "tweets": "tweets",
+    "movies": "movies",
+    "links": "links",
+    "authors": "authors",
+    "final_url": "final_url",
+    "link_hash": None,
+    "raw_html": None,
+    "schema": "schema",
+    "doc": "cleaned_text",
+    "raw_doc": None,
+    "publish_date": "publish_date",
+    "publish_datetime_utc": "publish_date",
+    "additional_data": None,
+    "timings": None,
+    "counters": None,
+    "fingerprint": "fingerprint",
+    "oversized": None,
+    "deadline_exceeded": None,
+}
+
+
+def resolve_stages(config: Configuration, fields: Optional[Iterable[str]]) -> Optional[Set[str]]:
+    """Determine the processing stages needed to set the article fields; `None` meaning all of them"""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+
+    unknown = sorted(set(fields) - set(FIELD_STAGES))
+    if unknown:
+        raise ValueError(f"Unknown article fields: {', '.join(unknown)}")
+
+    stages = set()
+    pending = [FIELD_STAGES[field] for field in fields if FIELD_STAGES[field] is not None]
+    while pending:
+        stage = pending.pop()
+        if stage in stages:
+            continue
+        stages.add(stage)
+        for dependency in STAGE_DEPENDENCIES[stage]:
+            # the language is only used for the content when taken from the meta tags
+            if dependency == "language" and not config.use_meta_language:
+                continue
+            pending.append(dependency)
+    return stages
+
 
 class CrawlCandidate:
-    def __init__(self, config: Configuration, url: str, raw_html: str):
+    def __init__(
+        self,
+        config: Configuration,
+        url: str,
+        raw_html: str,
+        fields: Optional[Iterable[str]] = None,
+        deadline: Optional[float] = None,
+    ):
         self.config = config
         # parser
         self.parser = self.config.get_parser()
         self.url = url
         self.raw_html = raw_html
+        # processing stages to run; all of them if None
+        self.stages = resolve_stages(config, fields)
+        # monotonic time the extraction must be done by; the budget starts with the candidate
+        self.deadline = time.monotonic() + deadline if deadline is not None else None
 
 
 class Crawler:
@@ -113,7 +217,7 @@ class Crawler:
         self.title_extractor = self.get_title_extractor()
 
         # html fetcher
-        if isinstance(fetcher, NetworkFetcher):
+        if isinstance(fetcher, (NetworkFetcher, AsyncNetworkFetcher)):
             self.fetcher = fetcher
         else:
             self.fetcher = NetworkFetcher(self.config)
@@ -121,39 +225,141 @@ class Crawler:
         # image extractor
         self.image_extractor = self.get_image_extractor()
 
+        # instrumentation of the extraction in progress
+        self.recorder = None
+        self._recording_depth = 0
+
+    def reset(self):
+        """Start over with a new article so that the crawler and its extractors can be reused for another
+        extraction; the previously returned article is left untouched"""
+        self.parser = self.config.get_parser()
+        self.article = Article()
+        self.recorder = None
+        self._recording_depth = 0
+        # the configured implementations may have changed since the last extraction
+        if type(self.extractor) is not self.config.content_extractor_class:
+            self.extractor = self.get_extractor()
+        if type(self.cleaner) is not self.config.document_cleaner_class:
+            self.cleaner = self.get_cleaner()
+        for component in (
+            self.extractor,
+            self.cleaner,
+            self.formatter,
+            self.metas_extractor,
+            self.opengraph_extractor,
+            self.schema_extractor,
+            self.publishdate_extractor,
+            self.tags_extractor,
+            self.authors_extractor,
+            self.tweets_extractor,
+            self.links_extractor,
+            self.video_extractor,
+            self.title_extractor,
+            self.image_extractor,
+        ):
+            component.reset(self.article)
+
     def crawl(self, crawl_candidate):
         # parser candidate
         parse_candidate = self.get_parse_candidate(crawl_candidate)
 
-        # raw html
-        raw_html = self.get_html(crawl_candidate, parse_candidate)
-
-        if raw_html is None:
-            logger.warning("No raw_html is provided or could be fetched; continuing with an empty Article object")
-            return self.article
+        with self._recording():
+            # raw html
+            with self._stage("fetch"):
+                raw_html = self.get_html(crawl_candidate, parse_candidate)
+
+            if raw_html is None:
+                logger.warning("No raw_html is provided or could be fetched; continuing with an empty Article object")
+                return self.article
+
+            return self.process(
+                raw_html,
+                parse_candidate.url,
+                parse_candidate.link_hash,
+                crawl_candidate.stages,
+                crawl_candidate.deadline,
+            )
+
+    def process(
+        self,
+        raw_html: str,
+        final_url: str,
+        link_hash: str,
+        stages: Optional[Set[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> Article:
+        self.article._deadline = deadline
+        with self._recording():
+            try:
+                cache = self.config.result_cache
+                if cache is None:
+                    return self._process(raw_html, final_url, link_hash, stages)
+
+                key = cache_key(self.config, raw_html, final_url, stages)
+                with self._stage("cache"):
+                    article = cache.get_article(key)
+                if article is not None:
+                    # the pristine document can be parsed again if needed; the other trees are gone
+                    article._raw_doc_loader = self._raw_doc_loader(article, article.raw_html or raw_html)
+                    # the link hash names the files of this extraction, such as the images downloaded
+                    article._link_hash = link_hash
+                    self.article = article
+                    return article
+
+                # the articles cut short do not make it to the cache
+                article = self._process(raw_html, final_url, link_hash, stages)
+                with self._stage("cache"):
+                    cache.set_article(key, article)
+                return article
+            except DeadlineExceeded:
+                return self._cut_short()
+
+    def _cut_short(self) -> Article:
+        """Give the article back as it is once the deadline passed"""
+        logger.warning("The deadline passed; the extraction of %s is cut short", self.article.final_url or "the html")
+        self.article._deadline = None
+        self.article._deadline_exceeded = True
+        # the top node is only set once cleaned up along with the cleaned text
+        if not self.article._cleaned_text:
+            self.article._top_node = None
+        self.release_resources()
+        return self.article
 
-        return self.process(raw_html, parse_candidate.url, parse_candidate.link_hash)
+    def _process(self, raw_html, final_url, link_hash, stages):
+        def wanted(stage):
+            return stages is None or stage in stages
 
-    def process(self, raw_html: str, final_url: str, link_hash: str) -> Article:
         # create document
-        doc = self.get_document(raw_html)
+        with self._stage("parse"):
+            raw_html = self.limit_html(raw_html)
+            doc = self.limit_document(self.get_document(raw_html))
 
-        # article
-        self.article._link_hash = link_hash
-        self.article._raw_html = raw_html
-        self.article._doc = doc
-        self.article._raw_doc = deepcopy(doc)
+            # article
+            self.article._link_hash = link_hash
+            self.article._raw_html = raw_html
+            self.article._doc = doc
+            # only the metadata of the documents over the limits may be wanted
+            metadata_only = self.article._oversized and self.config.oversize_policy == "metadata"
+            if self.config.lazy_raw_doc or not wanted("top_image") or metadata_only:
+                # parse the pristine document again only if something asks for it
+                self.article._raw_doc_loader = self._raw_doc_loader(self.article, raw_html)
+            else:
+                self.article._raw_doc = deepcopy(doc)
 
         # open graph
-        self.article._opengraph = self.opengraph_extractor.extract()
+        if wanted("opengraph"):
+            with self._stage("opengraph"):
+                self.article._opengraph = self.opengraph_extractor.extract()
 
         # schema.org:
         #  - (ReportageNewsArticle) https://pending.schema.org/ReportageNewsArticle
         #  - (NewsArticle) https://schema.org/NewsArticle
         #  - (Article) https://schema.org/Article
-        self.article._schema = self.schema_extractor.extract()
+        if wanted("schema"):
+            with self._stage("schema"):
+                self.article._schema = self.schema_extractor.extract()
 
-        if not self.article._final_url:
+        if wanted("final_url") and not self.article._final_url:
             if "url" in self.article.opengraph:
                 self.article._final_url = self.article.opengraph["url"]
             elif self.article.schema and "url" in self.article.schema:
@@ -165,92 +371,174 @@ class Crawler:
                 self.article._final_url = self.article._final_url[0]
 
         # meta
-        metas = self.metas_extractor.extract()
-        # print(metas)
-        self.article._meta_lang = metas["lang"]
-        self.article._meta_favicon = metas["favicon"]
-        self.article._meta_description = metas["description"]
-        self.article._meta_keywords = metas["keywords"]
-        self.article._meta_encoding = metas["encoding"]
-        self.article._canonical_link = metas["canonical"]
-        self.article._domain = metas["domain"]
+        if wanted("metas"):
+            with self._stage("metas"):
+                metas = self.metas_extractor.extract()
+            # print(metas)
+            self.article._meta_lang = metas["lang"]
+            self.article._meta_favicon = metas["favicon"]
+            self.article._meta_description = metas["description"]
+            self.article._meta_keywords = metas["keywords"]
+            self.article._meta_encoding = metas["encoding"]
+            self.article._canonical_link = metas["canonical"]
+            self.article._domain = metas["domain"]
 
         # publishdate
-        self.article._publish_date = self.publishdate_extractor.extract()
-        self.article._publish_datetime_utc = self._publish_date_to_utc() if self.article.publish_date else None
+        if wanted("publish_date"):
+            with self._stage("publishdate"):
+                self.article._publish_date = self.publishdate_extractor.extract()
+                self.article._publish_datetime_utc = self._publish_date_to_utc() if self.article.publish_date else None
 
         # tags
-        self.article._tags = self.tags_extractor.extract()
+        if wanted("tags"):
+            with self._stage("tags"):
+                self.article._tags = self.tags_extractor.extract()
 
         # authors
-        self.article._authors = self.authors_extractor.extract()
+        if wanted("authors"):
+            with self._stage("authors"):
+                self.article._authors = self.authors_extractor.extract()
 
         # title
-        self.article._title = self.title_extractor.extract()
+        if wanted("title"):
+            with self._stage("title"):
+                self.article._title = self.title_extractor.extract()
 
         # jump through some hoops on attempting to get a language if not found
-        if self.article._meta_lang is None:
-            self.article._meta_lang = self._alternative_language_extractor()
-
-        # check for known node as content body
-        # if we find one force the article.doc to be the found node
-        # this will prevent the cleaner to remove unwanted text content
-        article_body = self.extractor.get_known_article_tags()
-        if article_body is not None:
-            doc = article_body
-
-        # before we do any calcs on the body itself let's clean up the document
-        if not isinstance(doc, list):
-            doc = [self.cleaner.clean(doc)]
-        else:
-            doc = [self.cleaner.clean(deepcopy(x)) for x in doc]
+        if wanted("language") and self.article._meta_lang is None:
+            # the alternative language extractor guesses from the title and the tags
+            if not wanted("title"):
+                with self._stage("title"):
+                    self.article._title = self.title_extractor.extract()
+            if not wanted("tags"):
+                with self._stage("tags"):
+                    self.article._tags = self.tags_extractor.extract()
+            with self._stage("language"):
+                self.article._meta_lang = self._alternative_language_extractor()
+
+        if wanted("content") and not metadata_only:
+            self._process_content(raw_html, doc, wanted)
+
+        # simhash of the text for near duplicate detection; opt-in unless asked for explicitly
+        if wanted("fingerprint") and (self.config.enable_fingerprint or stages is not None):
+            with self._stage("fingerprint"):
+                stopwords = self.config.stopwords_class.for_language(self.extractor.get_language())
+                self.article._fingerprint = text_fingerprint(self.article.cleaned_text, stopwords)
+
+        # cleanup tmp file
+        self.release_resources()
+
+        # done within the deadline
+        self.article._deadline = None
+
+        # return the article
+        return self.article
+
+    def _process_content(self, raw_html, doc, wanted):
+        with self._stage("clean"):
+            # check for known node as content body
+            # if we find one force the article.doc to be the found node
+            # this will prevent the cleaner to remove unwanted text content
+            article_body = self.extractor.get_known_article_tags()
+            if article_body is not None:
+                doc = article_body
+
+            # before we do any calcs on the body itself let's clean up the document
+            detached = False
+            if not isinstance(doc, list):
+                doc = [self.cleaner.clean(doc)]
+            elif self.config.lazy_raw_doc and not self._overlapping_nodes(doc):
+                # take the nodes out of the document instead of copying them
+                doc = [self.cleaner.clean(self._detach_node(x)) for x in doc]
+                detached = True
+            else:
+                doc = [self.cleaner.clean(deepcopy(x)) for x in doc]
 
         # big stuff
-        self.article._top_node = self.extractor.calculate_best_node(doc)
+        with self._stage("calculate_best_node"):
+            self.article._top_node = self.extractor.calculate_best_node(doc)
 
-        # if we do not find an article within the discovered possible article nodes,
-        # try again with the root node.
-        if self.article._top_node is None:
+            # if we do not find an article within the discovered possible article nodes,
             # try again with the root node.
-            self.article._top_node = self.extractor.calculate_best_node(self.article._doc)
-        else:
-            # set the doc member to the discovered article node.
-            self.article._doc = doc
+            if self.article._top_node is None:
+                # the known nodes were taken out of the document; start over from an untouched one
+                if detached:
+                    self.article._doc = self.limit_document(self.get_document(raw_html))
+                # try again with the root node.
+                self.article._top_node = self.extractor.calculate_best_node(self.article._doc)
+            else:
+                # set the doc member to the discovered article node.
+                self.article._doc = doc
 
         # if we have a top node
         # let's process it
         if self.article._top_node is not None:
             # article links
-            self.article._links = self.links_extractor.extract()
+            if wanted("links"):
+                with self._stage("links"):
+                    self.article._links = self.links_extractor.extract()
 
             # tweets
-            self.article._tweets = self.tweets_extractor.extract()
+            if wanted("tweets"):
+                with self._stage("tweets"):
+                    self.article._tweets = self.tweets_extractor.extract()
 
             # video handling
-            self.article._movies = self.video_extractor.get_videos()
+            if wanted("movies"):
+                with self._stage("videos"):
+                    self.article._movies = self.video_extractor.get_videos()
 
             # image handling
-            if self.config.enable_image_fetching:
-                self.get_image()
+            if self.config.enable_image_fetching and wanted("top_image"):
+                with self._stage("images"):
+                    self.get_image()
 
             # post cleanup
-            self.article._top_node_raw_html = etree.tostring(self.article.top_node).decode("utf-8")
-            self.article._top_node = self.extractor.post_cleanup()
+            with self._stage("post_cleanup"):
+                if wanted("top_node_raw_html"):
+                    self.article._top_node_raw_html = etree.tostring(self.article.top_node).decode("utf-8")
+                self.article._top_node = self.extractor.post_cleanup()
 
             # clean_text
-            self.article._cleaned_text = self.formatter.get_formatted_text()
-
-        # cleanup tmp file
-        self.release_resources()
-
-        # return the article
-        return self.article
+            if wanted("cleaned_text"):
+                with self._stage("formatter"):
+                    self.article._cleaned_text = self.formatter.get_formatted_text(self.extractor)
+
+    @contextmanager
+    def _recording(self, finish: bool = True):
+        """Record the timings and counters of the enclosed block when instrumentation is enabled; the results are
+        attached to the article when the outermost block set to `finish` exits"""
+        if not self.config.enable_instrumentation:
+            yield
+            return
+
+        if self.recorder is None:
+            self.recorder = Recorder()
+        self._recording_depth += 1
+        try:
+            with self.recorder.activate():
+                yield
+        finally:
+            self._recording_depth -= 1
+        if finish and self._recording_depth == 0:
+            self.article._timings = self.recorder.timings
+            self.article._counters = self.recorder.counters
+            GLOBAL_STATS.add(self.recorder)
+            self.recorder = None
+
+    def _stage(self, name: str):
+        # the stages only start within the deadline
+        self.extractor.check_deadline()
+        if self.recorder is None:
+            return _NO_STAGE
+        return self.recorder.stage(name)
 
     @staticmethod
     def get_parse_candidate(crawl_candidate: CrawlCandidate) -> ParsingCandidate:
+        algorithm = crawl_candidate.config.fingerprint_algorithm
         if crawl_candidate.raw_html:
-            return RawHelper.get_parsing_candidate(crawl_candidate.url, crawl_candidate.raw_html)
-        return URLHelper.get_parsing_candidate(crawl_candidate.url)
+            return RawHelper.get_parsing_candidate(crawl_candidate.url, crawl_candidate.raw_html, algorithm)
+        return URLHelper.get_parsing_candidate(crawl_candidate.url, algorithm)
 
     def get_image(self):
         top_node = self.article.top_node
@@ -281,6 +569,35 @@ class Crawler:
                 self.article._meta_encoding = encodings
         return html
 
+    async def aget_html(self, crawl_candidate: CrawlCandidate, parsing_candidate: ParsingCandidate) -> str:
+        """asyncio version of `get_html`; requires the crawler to use an AsyncNetworkFetcher"""
+        with self._recording(finish=False), self._stage("fetch"):
+            return await self._aget_html(crawl_candidate, parsing_candidate)
+
+    async def _aget_html(self, crawl_candidate: CrawlCandidate, parsing_candidate: ParsingCandidate) -> str:
+        if crawl_candidate.raw_html:
+            logger.debug("Using raw_html for %s", crawl_candidate)
+            return crawl_candidate.raw_html
+
+        # fetch HTML
+        logger.debug("Fetching html from %s", crawl_candidate.url)
+        response = await self.fetcher.afetch_obj(parsing_candidate.url)
+        if response.charset_encoding:  # the server told us; use what it says
+            html = response.text
+            self.article._meta_encoding = response.encoding
+        else:
+            html = response.content
+            encodings = get_encodings_from_content(response.content)
+            if len(encodings) > 0:
+                self.article._meta_encoding = encodings[0]
+                try:
+                    html = response.content.decode(encodings[0], errors="replace")
+                except LookupError:
+                    html = response.text
+            else:
+                self.article._meta_encoding = encodings
+        return html
+
     def get_metas_extractor(self):
         return MetasExtractor(self.config, self.article)
 
@@ -318,14 +635,77 @@ class Crawler:
         return StandardOutputFormatter(self.config, self.article)
 
     def get_cleaner(self):
-        return StandardDocumentCleaner(self.config, self.article)
+        return self.config.document_cleaner_class(self.config, self.article)
 
     def get_document(self, raw_html):
         doc = self.parser.fromstring(raw_html)
         return doc
 
+    def limit_html(self, raw_html):
+        """Apply `max_html_bytes` to the html before it gets parsed, following `oversize_policy`"""
+        limit = self.config.max_html_bytes
+        if limit is None or len(raw_html) <= limit // 4:
+            return raw_html
+        html = raw_html.encode("utf-8") if isinstance(raw_html, str) else raw_html
+        if len(html) <= limit:
+            return raw_html
+        if self.config.oversize_policy == "reject":
+            raise DocumentTooLargeError(len(html), limit, "bytes")
+
+        logger.warning("The html is %d bytes, truncated to the first %d", len(html), limit)
+        self.article._oversized = True
+        # cut before the last tag starting within the limit, the parser closes the open ones
+        html = html[:limit]
+        end = html.rfind(b"<")
+        if end > 0:
+            html = html[:end]
+        return html.decode("utf-8", "ignore") if isinstance(raw_html, str) else html
+
+    def limit_document(self, doc):
+        """Apply `max_dom_nodes` to the parsed document, following `oversize_policy`"""
+        limit = self.config.max_dom_nodes
+        if limit is None:
+            return doc
+        size = int(doc.xpath("count(descendant-or-self::*)"))
+        if size <= limit:
+            return doc
+        if self.config.oversize_policy == "reject":
+            raise DocumentTooLargeError(size, limit, "nodes")
+
+        logger.warning("The document has %d nodes, truncated to the first %d", size, limit)
+        self.article._oversized = True
+        return self._truncate_document(doc, limit)
+
+    def _raw_doc_loader(self, article, raw_html):
+        """Parse the pristine document again when asked for, truncated as the document of the article was"""
+        limit = self.config.max_dom_nodes if article.oversized else None
+        return partial(self._parse_document, self.parser, raw_html, limit)
+
+    @classmethod
+    def _parse_document(cls, parser, raw_html, limit=None):
+        doc = parser.fromstring(raw_html)
+        return doc if limit is None else cls._truncate_document(doc, limit)
+
+    @staticmethod
+    def _truncate_document(doc, limit):
+        """Keep the first `limit` nodes of the document, in document order"""
+        over = doc.xpath(f"(descendant-or-self::*)[{limit + 1}]")
+        if not over:
+            return doc
+        # drop the first node over the limit and everything after it in document order: its following siblings and
+        # the following siblings of its ancestors
+        first = over[0]
+        dropped = [first, *first.itersiblings()]
+        for ancestor in first.iterancestors():
+            if ancestor is doc:
+                break
+            dropped.extend(ancestor.itersiblings())
+        for node in dropped:
+            node.getparent().remove(node)
+        return doc
+
     def get_extractor(self):
-        return StandardContentExtractor(self.config, self.article)
+        return self.config.content_extractor_class(self.config, self.article)
 
     def release_resources(self):
         path = os.path.join(self.config.local_storage_path, f"{self.article.link_hash}_*")
@@ -335,6 +715,27 @@ class Crawler:
             except OSError:
                 logger.error("File %s could not be removed", fname)
 
+    @staticmethod
+    def _overlapping_nodes(nodes) -> bool:
+        """Determine if any of the nodes is repeated or contained in another one of the nodes"""
+        seen = set()
+        for node in nodes:
+            if node in seen:
+                return True
+            seen.add(node)
+        for node in nodes:
+            for ancestor in node.iterancestors():
+                if ancestor in seen:
+                    return True
+        return False
+
+    @staticmethod
+    def _detach_node(node):
+        parent = node.getparent()
+        if parent is not None:
+            parent.remove(node)
+        return node
+
     def _publish_date_to_utc(self):
         try:
             publish_datetime = dateutil.parser.parse(self.article.publish_date, tzinfos=TIMEZONE_INFO)
@@ -0,0 +1,163 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from goose3.text import StopWords
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+FINGERPRINT_BITS = 64
+# number of candidates from which the hamming distances are computed with numpy
+_VECTORIZE_MIN_CANDIDATES = 64
+
+
+def tokenize(text: str, stopwords: StopWords) -> List[str]:
+    """Split the text into lower case words the same way the stop words counting does"""
+    words = stopwords.candidate_words(stopwords.remove_punctuation(text))
+    return [word.lower() for word in words if word and not word.isspace()]
+
+
+def shingle_hashes(tokens: Sequence[str], size: int = 3) -> List[int]:
+    """64 bit hashes of the runs of `size` consecutive tokens"""
+    if not tokens:
+        return []
+    if len(tokens) <= size:
+        shingles = [" ".join(tokens)]
+    else:
+        shingles = [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+    return [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big") for shingle in shingles
+    ]
+
+
+def simhash(hashes: Sequence[int]) -> Optional[int]:
+    """Combine the 64 bit hashes of the features of a document into its SimHash; `None` without features"""
+    if not hashes:
+        return None
+    total = len(hashes)
+    if np is not None:
+        values = np.array(hashes, dtype=np.uint64)
+        shifts = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+        counts = ((values[:, None] >> shifts) & np.uint64(1)).sum(axis=0)
+        bits = [int(count) * 2 > total for count in counts]
+    else:
+        bits = [sum((value >> bit) & 1 for value in hashes) * 2 > total for bit in range(FINGERPRINT_BITS)]
+
+    result = 0
+    for bit, is_set in enumerate(bits):
+        if is_set:
+            result |= 1 << bit
+    return result
+
+
+def text_fingerprint(text: str, stopwords: StopWords, shingle_size: int = 3) -> Optional[int]:
+    """SimHash of the shingles of the words of the text; `None` if the text has no words"""
+    return simhash(shingle_hashes(tokenize(text, stopwords), shingle_size))
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Number of bits that differ between two fingerprints"""
+    return bin(first ^ second).count("1")
+
+
+class SimHashIndex:
+    """In memory index of fingerprints answering which of them are within a hamming distance of a fingerprint
+
+    The fingerprints are split in `max_distance + 1` bands; two fingerprints within `max_distance` of each other
+    have at least one identical band, so only the fingerprints sharing a band with the query are compared.
+
+    Args:
+        max_distance (int): The largest number of differing bits for fingerprints to be near duplicates
+    """
+
+    def __init__(self, max_distance: int = 3):
+        if not 0 <= max_distance < FINGERPRINT_BITS:
+            raise ValueError(f"max_distance must be between 0 and {FINGERPRINT_BITS - 1}")
+        self.max_distance = max_distance
+        self._bands = self._band_masks(max_distance + 1)
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._keys: List[Hashable] = []
+        self._fingerprints: List[int] = []
+
+    @staticmethod
+    def _band_masks(count: int) -> List[Tuple[int, int]]:
+        """(shift, mask) of each band; the bits are spread as evenly as possible"""
+        bands = []
+        start = 0
+        for i in range(count):
+            width = FINGERPRINT_BITS // count + (1 if i < FINGERPRINT_BITS % count else 0)
+            bands.append((start, (1 << width) - 1))
+            start += width
+        return bands
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key: Hashable, fingerprint: int):
+        """Add the fingerprint of the document identified by key"""
+        position = len(self._keys)
+        self._keys.append(key)
+        self._fingerprints.append(fingerprint)
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            buckets.setdefault((fingerprint >> shift) & mask, []).append(position)
+
+    def query(self, fingerprint: int) -> List[Tuple[Hashable, int]]:
+        """Find the documents within `max_distance` of the fingerprint
+
+        Returns:
+            list((key, distance)): The keys of the near duplicates with their distance, closest first"""
+        candidates = set()
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            candidates.update(buckets.get((fingerprint >> shift) & mask, ()))
+        if not candidates:
+            return []
+
+        positions = sorted(candidates)
+        distances = self._distances(fingerprint, positions)
+        found = [(self._keys[p], d) for p, d in zip(positions, distances) if d <= self.max_distance]
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def add_if_new(self, key: Hashable, fingerprint: int) -> Optional[Hashable]:
+        """Add the fingerprint unless a near duplicate is already indexed
+
+        Returns:
+            The key of the closest near duplicate if there is one, otherwise `None` after adding the fingerprint"""
+        found = self.query(fingerprint)
+        if found:
+            return found[0][0]
+        self.add(key, fingerprint)
+        return None
+
+    def _distances(self, fingerprint: int, positions: Iterable[int]) -> List[int]:
+        positions = list(positions)
+        if np is None or len(positions) < _VECTORIZE_MIN_CANDIDATES:
+            return [hamming_distance(fingerprint, self._fingerprints[p]) for p in positions]
+        values = np.fromiter((self._fingerprints[p] for p in positions), dtype=np.uint64, count=len(positions))
+        xor = values ^ np.uint64(fingerprint)
+        bits = np.unpackbits(xor.view(np.uint8).reshape(-1, 8), axis=1)
+        return bits.sum(axis=1).tolist()
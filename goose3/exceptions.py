@@ -1,3 +1,27 @@
 from .network import NetworkError
 
-__all__ = ["NetworkError"]
+
+class DocumentTooLargeError(RuntimeError):
+    """The html or the parsed document went over `Configuration.max_html_bytes` or `Configuration.max_dom_nodes`"""
+
+    def __init__(self, size, limit, unit):
+        # all the arguments are kept so that the error can be pickled, e.g. back from the batch workers
+        super().__init__(size, limit, unit)
+        self.size = size
+        self.limit = limit
+        self.unit = unit
+
+    @property
+    def message(self):
+        return f"DocumentTooLargeError: {self.size} {self.unit} over the limit of {self.limit} {self.unit}"
+
+    def __str__(self):
+        return self.message
+
+
+class DeadlineExceeded(RuntimeError):
+    """The deadline of the extraction passed; raised within the extraction, which then returns the article as it is
+    with `article.deadline_exceeded` set"""
+
+
+__all__ = ["DeadlineExceeded", "DocumentTooLargeError", "NetworkError"]
@@ -20,6 +20,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import time
+
+from goose3.exceptions import DeadlineExceeded
+
 
 class BaseExtractor:
     def __init__(self, config, article):
@@ -34,3 +38,15 @@ class BaseExtractor:
 
         # stopwords class
         self.stopwords_class = config.stopwords_class
+
+    def reset(self, article):
+        """Bind the extractor to a new article so that it can be reused"""
+        self.parser = self.config.get_parser()
+        self.article = article
+        self.stopwords_class = self.config.stopwords_class
+
+    def check_deadline(self):
+        """Stop the extraction with a `DeadlineExceeded` once the deadline of the article passed"""
+        deadline = self.article._deadline
+        if deadline is not None and time.monotonic() > deadline:
+            raise DeadlineExceeded()
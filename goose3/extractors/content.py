@@ -23,9 +23,77 @@ limitations under the License.
 from copy import deepcopy
 
 from goose3.extractors import BaseExtractor
+from goose3.instrumentation import NODES_SCANNED, count
+from goose3.nodestats import GravityScores, NodeStatistics
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+
+# tags of the nodes dividing the text of a document in blocks, for the text density
+DENSITY_BLOCK_TAGS = frozenset(
+    [
+        "article",
+        "aside",
+        "blockquote",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "li",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    ]
+)
+
+# tags of the nodes whose text is not part of the text of the document
+NON_TEXT_TAGS = frozenset(["noscript", "script", "style", "template"])
 
 
 class ContentExtractor(BaseExtractor):
+    # whether the paragraphs are weighted by their number of stop words; the output formatter follows
+    stopword_scoring = True
+    # a paragraph weighting more counts for the siblings of the top node
+    min_paragraph_score = 2
+
+    def __init__(self, config, article):
+        super().__init__(config, article)
+        self._node_stats = None
+
+    def reset(self, article):
+        super().reset(article)
+        self._node_stats = None
+
+    @property
+    def node_stats(self):
+        """The text statistics of the nodes of the document being extracted, shared by the scoring and the post
+        cleanup"""
+        language = self.get_language()
+        stats = self._node_stats
+        if stats is None or stats.language != language or not isinstance(stats.stopwords, self.stopwords_class):
+            stats = NodeStatistics(self.parser, self.stopwords_class.for_language(language), language)
+            self._node_stats = stats
+        return stats
+
     def get_language(self):
         """Returns the language is by the article or the configuration language"""
         # we don't want to force the target language
@@ -74,30 +142,25 @@ class ContentExtractor(BaseExtractor):
     def calculate_best_node(self, doc):
         top_node = None
         nodes_to_check = self.nodes_to_check(doc)
-
-        # update all parents
-        def loc_update_parent(node, upscore, depth=1):
-            parent_node = self.parser.get_parent(node)
-            if parent_node is not None:
-                self.update_score(parent_node, upscore * (1.5 / (depth + 0.5)))
-                self.update_node_count(parent_node, 1)
-
-                if parent_node not in parent_nodes:
-                    parent_nodes.append(parent_node)
-
-                loc_update_parent(parent_node, upscore, depth + 1)
+        count(NODES_SCANNED, len(nodes_to_check))
+        # the cleaner changed the document since the table was last used
+        node_stats = self.node_stats
+        node_stats.clear()
+        node_stats.add_many(nodes_to_check)
+        self.article._gravity_scores = None if self.config.gravity_score_attributes else GravityScores()
 
         starting_boost = float(1.0)
         cnt = 0
         i = 0
-        parent_nodes = []
+        # score and number of scored nodes accumulated for every parent, in the order the parents are first reached;
+        # they are written once per parent after the loop
+        parent_scores = {}
+        parent_counts = {}
         nodes_with_text = []
 
         for node in nodes_to_check:
-            text_node = self.parser.get_text(node)
-            word_stats = self.stopwords_class(language=self.get_language()).get_stopword_count(text_node)
-            high_link_density = self.is_highlink_density(node)
-            if word_stats.get_stopword_count() > 2 and not high_link_density:
+            self.check_deadline()
+            if node_stats.get(node).stopword_count > 2 and not self.is_highlink_density(node):
                 nodes_with_text.append(node)
 
         nodes_number = len(nodes_with_text)
@@ -105,6 +168,7 @@ class ContentExtractor(BaseExtractor):
         bottom_negativescore_nodes = float(nodes_number) * 0.25
 
         for node in nodes_with_text:
+            self.check_deadline()
             boost_score = float(0)
             # boost
             if self.is_boostable(node):
@@ -120,17 +184,22 @@ class ContentExtractor(BaseExtractor):
                     if negscore > 40:
                         boost_score = float(5)
 
-            text_node = self.parser.get_text(node)
-            word_stats = self.stopwords_class(language=self.get_language()).get_stopword_count(text_node)
-            upscore = int(word_stats.get_stopword_count() + boost_score)
+            upscore = int(node_stats.get(node).stopword_count + boost_score)
 
-            loc_update_parent(node, upscore)
+            # update all parents, the further away the less
+            for depth, parent_node in enumerate(node.iterancestors(), 1):
+                parent_scores[parent_node] = parent_scores.get(parent_node, 0) + int(upscore * (1.5 / (depth + 0.5)))
+                parent_counts[parent_node] = parent_counts.get(parent_node, 0) + 1
 
             cnt += 1
             i += 1
 
+        for parent_node, score in parent_scores.items():
+            self.update_score(parent_node, score)
+            self.update_node_count(parent_node, parent_counts[parent_node])
+
         top_node_score = 0
-        for itm in parent_nodes:
+        for itm in parent_scores:
             score = self.get_score(itm)
 
             if score > top_node_score:
@@ -152,16 +221,14 @@ class ContentExtractor(BaseExtractor):
         minimum_stopword_count = 5
         max_stepsaway_from_node = 3
 
-        nodes = self.walk_siblings(node)
-        for current_node in nodes:
+        # walk the previous siblings lazily, the answer is usually known after a few of them
+        for current_node in node.itersiblings(preceding=True):
             # p
             current_node_tag = self.parser.get_tag(current_node)
             if current_node_tag == para:
                 if steps_away >= max_stepsaway_from_node:
                     return False
-                para_text = self.parser.get_text(current_node)
-                word_stats = self.stopwords_class(language=self.get_language()).get_stopword_count(para_text)
-                if word_stats.get_stopword_count() > minimum_stopword_count:
+                if self.node_stats.get(current_node).stopword_count > minimum_stopword_count:
                     return True
                 steps_away += 1
         return False
@@ -195,17 +262,19 @@ class ContentExtractor(BaseExtractor):
             if tmp.tail:
                 tmp = deepcopy(tmp)
                 tmp.tail = ""
+                if self.article._gravity_scores is not None:
+                    self.article._gravity_scores.copy_scores(current_sibling, tmp)
             return [tmp]
         potential_paragraphs = self.parser.get_elements_by_tag(current_sibling, tag="p")
         if potential_paragraphs is None:
             return None
 
         paragraphs = []
+        node_stats = self.node_stats
         for first_paragraph in potential_paragraphs:
-            text = self.parser.get_text(first_paragraph)
+            text = node_stats.get(first_paragraph).text
             if text:  # no len(text) > 0
-                word_stats = self.stopwords_class(language=self.get_language()).get_stopword_count(text)
-                paragraph_score = word_stats.get_stopword_count()
+                paragraph_score = self.paragraph_score(first_paragraph)
                 sibling_baseline_score = float(0.30)
                 high_link_density = self.is_highlink_density(first_paragraph)
                 score = float(baselinescore_siblings_para * sibling_baseline_score)
@@ -227,21 +296,28 @@ class ContentExtractor(BaseExtractor):
         nodes_to_check = self.parser.get_elements_by_tag(top_node, tag="p")
 
         for node in nodes_to_check:
-            text_node = self.parser.get_text(node)
-            word_stats = self.stopwords_class(language=self.get_language()).get_stopword_count(text_node)
-            high_link_density = self.is_highlink_density(node)
-            if word_stats.get_stopword_count() > 2 and not high_link_density:
+            paragraph_score = self.paragraph_score(node)
+            if paragraph_score > self.min_paragraph_score and not self.is_highlink_density(node):
                 paragraphs_number += 1
-                paragraphs_score += word_stats.get_stopword_count()
+                paragraphs_score += paragraph_score
 
         if paragraphs_number > 0:
             base = paragraphs_score // paragraphs_number
 
         return base
 
+    def paragraph_score(self, node):
+        """the weight of a paragraph for the siblings of the top node: its number of stop words"""
+        return self.node_stats.get(node).stopword_count
+
     def update_score(self, node, add_to_score):
         """adds a score to the gravityScore Attribute we put on divs we'll get the current score then add the score
         we're passing in to the current"""
+        scores = self.article._gravity_scores
+        if scores is not None:
+            scores.add_score(node, int(add_to_score))
+            return
+
         current_score = 0
         score_string = self.parser.get_attribute(node, "gravityScore")
         if score_string:
@@ -252,6 +328,11 @@ class ContentExtractor(BaseExtractor):
 
     def update_node_count(self, node, add_to_count):
         """stores how many decent nodes are under a parent node"""
+        scores = self.article._gravity_scores
+        if scores is not None:
+            scores.add_count(node, add_to_count)
+            return
+
         current_score = 0
         count_string = self.parser.get_attribute(node, "gravityNodes")
         if count_string:
@@ -263,21 +344,13 @@ class ContentExtractor(BaseExtractor):
     def is_highlink_density(self, element):
         """checks the density of links within a node, is there not much text and most of it contains linky shit?
         if so it's no good"""
-        links = self.parser.get_elements_by_tag(element, tag="a")
+        words, links, link_words = self.node_stats.link_stats(element)
         if not links:
             return False
 
-        text = self.parser.get_text(element)
-        words = text.split(" ")
-        words_number = float(len(words))
-        link_text_parts = []
-        for link in links:
-            link_text_parts.append(self.parser.get_text(link))
-
-        link_text = "".join(link_text_parts)
-        link_words = link_text.split(" ")
-        number_of_link_words = float(len(link_words))
-        number_of_links = float(len(links))
+        words_number = float(words)
+        number_of_link_words = float(link_words)
+        number_of_links = float(links)
         link_divisor = float(number_of_link_words / words_number)
         score = float(link_divisor * number_of_links)
         if score >= 1.0:
@@ -290,6 +363,10 @@ class ContentExtractor(BaseExtractor):
         return self.get_node_gravity_score(node) or 0
 
     def get_node_gravity_score(self, node):
+        scores = self.article._gravity_scores
+        if scores is not None:
+            return scores.get_score(node)
+
         grv_score_string = self.parser.get_attribute(node, "gravityScore")
         if not grv_score_string:
             return None
@@ -336,6 +413,8 @@ class ContentExtractor(BaseExtractor):
 
         target_node = self.article.top_node
         node = self.add_siblings(target_node)
+        # the siblings were moved into the top node and the loop below removes nodes
+        self.node_stats.clear()
         for elm in self.parser.get_children(node):
             e_tag = self.parser.get_tag(elm)
             if e_tag not in parse_tags:
@@ -345,8 +424,239 @@ class ContentExtractor(BaseExtractor):
                     or not self.is_nodescore_threshold_met(node, elm)
                 ):
                     self.parser.remove(elm)
+        self.node_stats.clear()
         return node
 
 
 class StandardContentExtractor(ContentExtractor):
     pass
+
+
+class VectorizedContentExtractor(ContentExtractor):
+    """Scores the candidate nodes with array operations over a flat table of the nodes and of their parents instead
+    of one node at a time; the scores and the top node are the ones of `StandardContentExtractor`
+
+    Note:
+        Uses `numpy` (`pip install goose3[numpy]`); without it, or for documents with few candidate nodes, the nodes
+        are scored one at a time"""
+
+    # number of candidate nodes from which the scoring uses numpy
+    min_nodes = 64
+
+    def calculate_best_node(self, doc):
+        nodes_to_check = self.nodes_to_check(doc)
+        if np is None or len(nodes_to_check) < self.min_nodes:
+            return super().calculate_best_node(doc)
+        count(NODES_SCANNED, len(nodes_to_check))
+        # the cleaner changed the document since the table was last used
+        node_stats = self.node_stats
+        node_stats.clear()
+        node_stats.add_many(nodes_to_check)
+        self.article._gravity_scores = None if self.config.gravity_score_attributes else GravityScores()
+
+        # nodes with enough stop words and not too many links
+        stopwords = np.fromiter(
+            (node_stats.get(node).stopword_count for node in nodes_to_check),
+            dtype=np.float64,
+            count=len(nodes_to_check),
+        )
+        link_stats = [node_stats.link_stats(node) for node in nodes_to_check]
+        self.check_deadline()
+        words, links, link_words = np.array(link_stats, dtype=np.float64).reshape(-1, 3).T
+        high_link_density = (links > 0) & (link_words / words * links >= 1.0)
+        selected = np.flatnonzero((stopwords > 2) & ~high_link_density)
+        if not len(selected):
+            return None
+        nodes_with_text = [nodes_to_check[i] for i in selected]
+        stopwords = stopwords[selected]
+        nodes_number = len(nodes_with_text)
+
+        # boost of the nodes following paragraphs, decreasing with the number of boosted nodes
+        boostable = self.boostable_nodes(nodes_with_text)
+        boost_score = np.where(boostable, (1.0 / np.maximum(np.cumsum(boostable), 1)) * 50, 0.0)
+        # penalty of the last quarter of the nodes
+        if nodes_number > 15:
+            bottom_negativescore_nodes = float(nodes_number) * 0.25
+            remaining = nodes_number - np.arange(nodes_number)
+            negative = -((bottom_negativescore_nodes - remaining) ** 2)
+            boost_score = np.where(
+                remaining <= bottom_negativescore_nodes, np.where(np.abs(negative) > 40, 5.0, negative), boost_score
+            )
+        upscore = np.trunc(stopwords + boost_score)
+
+        # the parents of the nodes up to the root, each pointing to its own parent
+        index = {}
+        parents = []
+        parent_nodes = []
+
+        def parent_index(node):
+            chain = []
+            node = node.getparent()
+            while node is not None and node not in index:
+                chain.append(node)
+                node = node.getparent()
+            idx = -1 if node is None else index[node]
+            for parent in reversed(chain):
+                index[parent] = len(parent_nodes)
+                parent_nodes.append(parent)
+                parents.append(idx)
+                idx = index[parent]
+            return idx
+
+        current = np.array([parent_index(node) for node in nodes_with_text], dtype=np.int64)
+        parents = np.array(parents, dtype=np.int64)
+
+        # update all parents, the further away the less, one level at a time for all the nodes; every parent
+        # remembers the first (node, depth) reaching it, the order in which the parents are looked at
+        scores = np.zeros(len(parent_nodes), dtype=np.int64)
+        counts = np.zeros(len(parent_nodes), dtype=np.int64)
+        stride = len(parent_nodes) + 1
+        first_reached = np.full(len(parent_nodes), nodes_number * stride, dtype=np.int64)
+        order = np.arange(nodes_number, dtype=np.int64)
+        depth = 1
+        while len(current):
+            reached = current >= 0
+            current, order, upscore = current[reached], order[reached], upscore[reached]
+            np.add.at(scores, current, np.trunc(upscore * (1.5 / (depth + 0.5))).astype(np.int64))
+            np.add.at(counts, current, 1)
+            np.minimum.at(first_reached, current, order * stride + depth)
+            current = parents[current]
+            depth += 1
+
+        scored = np.flatnonzero(counts)
+        # no parent to score, the text nodes being the roots
+        if not len(scored):
+            return None
+        scored = scored[np.argsort(first_reached[scored], kind="stable")]
+        for i in scored:
+            self.update_score(parent_nodes[i], int(scores[i]))
+            self.update_node_count(parent_nodes[i], int(counts[i]))
+
+        # the first of the best scores, or the first parent when none is positive
+        best = int(np.argmax(scores[scored]))
+        if scores[scored[best]] > 0:
+            return parent_nodes[scored[best]]
+        return parent_nodes[scored[0]]
+
+    def boostable_nodes(self, nodes):
+        """`is_boostable` of each of the nodes at once: whether one of the three closest paragraphs before the node
+        under the same parent has enough stop words"""
+        minimum_stopword_count = 5
+        max_stepsaway_from_node = 3
+        node_stats = self.node_stats
+
+        # boosting[k]: number of boosting paragraphs among the first k paragraphs of the parents walked
+        boosting = [0]
+        # number of paragraphs walked before each child, and before the first child of its parent
+        before = {}
+        walked = set()
+        for node in nodes:
+            parent = node.getparent()
+            if parent is None or parent in walked:
+                continue
+            walked.add(parent)
+            start = len(boosting) - 1
+            for child in parent:
+                before[child] = (len(boosting) - 1, start)
+                if child.tag == "p":
+                    is_boosting = node_stats.get(child).stopword_count > minimum_stopword_count
+                    boosting.append(boosting[-1] + is_boosting)
+
+        boosting = np.array(boosting, dtype=np.int64)
+        positions = np.array([before.get(node, (0, 0)) for node in nodes], dtype=np.int64).reshape(-1, 2)
+        paragraphs, starts = positions.T
+        closest = np.maximum(paragraphs - max_stepsaway_from_node, starts)
+        return boosting[paragraphs] - boosting[closest] > 0
+
+
+class DensityContentExtractor(ContentExtractor):
+    """Finds the article content from the density of the text of the nodes instead of their stop words, in a single
+    walk of the document whatever the language; for languages without a stop words list or with a costly word
+    segmentation
+
+    The density of a node is its number of characters out of links per block (itself and the blocks under it); the
+    top node is the one whose children are the densest, which favors the nodes holding many paragraphs of text over
+    the ones holding links or a single block. The paragraphs, and the nodes the output formatter keeps, are weighted
+    by their length instead of their number of stop words."""
+
+    stopword_scoring = False
+    # number of characters of the text of a paragraph, the formatter removes the shorter nodes
+    min_paragraph_score = 25
+
+    @property
+    def node_stats(self):
+        """The text statistics of the nodes of the document being extracted, without counting their stop words"""
+        if self._node_stats is None:
+            self._node_stats = NodeStatistics(self.parser, None)
+        return self._node_stats
+
+    def paragraph_score(self, node):
+        """the weight of a paragraph for the siblings of the top node: the length of its text"""
+        return self.node_stats.get(node).text_length
+
+    def calculate_best_node(self, doc):
+        self.node_stats.clear()
+        self.article._gravity_scores = None if self.config.gravity_score_attributes else GravityScores()
+
+        top_node = None
+        top_node_score = 0
+        for root in doc:
+            self.check_deadline()
+            scores = self.density_scores(root)
+            # in reverse document order, the first of the best scores comes last
+            for node, score in scores.items():
+                if score >= 1:
+                    self.update_score(node, score)
+                    if score >= top_node_score:
+                        top_node = node
+                        top_node_score = score
+        return top_node
+
+    def density_scores(self, root):
+        """The score of the elements under the root holding blocks: the number of characters out of links of their
+        own text plus the densities of their children, counted from the ones of the children, children first"""
+        # characters, characters of links and blocks of each element
+        counts = {}
+        scores = {}
+        nodes = list(root.iter())
+        count(NODES_SCANNED, len(nodes))
+        for node in reversed(nodes):
+            if not isinstance(node.tag, str):
+                continue
+            if node.tag in NON_TEXT_TAGS:
+                counts[node] = (0, 0, 0)
+                continue
+            is_link = node.tag == "a"
+            own_characters = count_characters(node.text)
+            characters = own_characters
+            link_characters = 0
+            blocks = 0
+            holds_blocks = False
+            score = 0.0
+            for child in node:
+                tail_characters = count_characters(child.tail)
+                characters += tail_characters
+                own_characters += tail_characters
+                if not isinstance(child.tag, str):
+                    continue
+                child_characters, child_link_characters, child_blocks = counts.pop(child)
+                characters += child_characters
+                link_characters += child_link_characters
+                blocks += child_blocks
+                holds_blocks = holds_blocks or child_blocks > 0
+                score += (child_characters - child_link_characters) / max(child_blocks, 1)
+            if is_link:
+                link_characters = characters
+            else:
+                score += own_characters
+            if own_characters and node.tag in DENSITY_BLOCK_TAGS:
+                blocks += 1
+            counts[node] = (characters, link_characters, blocks)
+            if holds_blocks:
+                scores[node] = int(score)
+        return scores
+
+
+def count_characters(text):
+    """number of characters of the text, spaces aside"""
+    return sum(map(len, text.split())) if text else 0
@@ -22,6 +22,7 @@ limitations under the License.
 
 import os
 import re
+from typing import Dict
 from urllib.parse import urljoin, urlparse
 
 from goose3.extractors import BaseExtractor
@@ -45,6 +46,8 @@ class DepthTraversal:
 
 
 class ImageExtractor(BaseExtractor):
+    _cached_site_mapping: Dict[str, str] = {}
+
     def __init__(self, fetcher, config, article):
         super().__init__(config, article)
 
@@ -294,6 +297,8 @@ class ImageExtractor(BaseExtractor):
 
     def get_local_image(self, src):
         """returns the bytes of the image file on disk"""
+        # each image may be downloaded
+        self.check_deadline()
         return ImageUtils.store_image(self.fetcher, self.article.link_hash, src, self.config)
 
     def get_clean_domain(self):
@@ -308,10 +313,11 @@ class ImageExtractor(BaseExtractor):
         * TODO: enable this to use a series of settings files so people can define what the image ids/classes are on
                 specific sites"""
         domain = self.get_clean_domain()
+        known_names = list(KNOWN_IMG_DOM_NAMES)
         if domain in self.custom_site_mapping:
             classes = self.custom_site_mapping.get(domain).split("|")
             for classname in classes:
-                KNOWN_IMG_DOM_NAMES.append(classname)
+                known_names.append(classname)
 
         image = None
         doc = self.article.raw_doc
@@ -327,7 +333,7 @@ class ImageExtractor(BaseExtractor):
             return None
 
         # check for elements with known id
-        for css in KNOWN_IMG_DOM_NAMES:
+        for css in known_names:
             elements = self.parser.get_elements_by_tag(doc, attr="id", value=css)
             image = _check_elements(elements)
             if image is not None:
@@ -336,7 +342,7 @@ class ImageExtractor(BaseExtractor):
                     return self.get_image(src, score=90, extraction_type="known")
 
         # check for elements with known classes
-        for css in KNOWN_IMG_DOM_NAMES:
+        for css in known_names:
             elements = self.parser.get_elements_by_tag(doc, attr="class", value=css)
             image = _check_elements(elements)
             if image is not None:
@@ -358,12 +364,14 @@ class ImageExtractor(BaseExtractor):
         return urljoin(self.article.final_url, src)
 
     def load_customesite_mapping(self):
-        path = os.path.join("resources", "images", "known-image-css.txt")
-        data_file = FileHelper.load_resource_file(path)
-        lines = data_file.splitlines()
-        for line in lines:
-            domain, css = line.split("^")
-            self.custom_site_mapping.update({domain: css})
+        if not self._cached_site_mapping:
+            path = os.path.join("resources", "images", "known-image-css.txt")
+            data_file = FileHelper.load_resource_file(path)
+            lines = data_file.splitlines()
+            for line in lines:
+                domain, css = line.split("^")
+                self._cached_site_mapping.update({domain: css})
+        self.custom_site_mapping.update(self._cached_site_mapping)
 
     def add_schema_if_none(self, src):
         src_test = urlparse(src)
@@ -30,9 +30,12 @@ class TweetsExtractor(BaseExtractor):
             self.article.top_node, tag="blockquote", attr="class", value="twitter-tweet"
         )
 
+        scores = self.article._gravity_scores
         for i in items:
             for attr in ["gravityScore", "gravityNodes"]:
                 self.parser.del_attribute(i, attr)
+            if scores is not None:
+                scores.discard(i)
             tweets.append(self.parser.node_to_string(i))
 
         return tweets
@@ -35,6 +35,11 @@ class VideoExtractor(BaseExtractor):
         self.candidates = []
         self.movies = []
 
+    def reset(self, article):
+        super().reset(article)
+        self.candidates = []
+        self.movies = []
+
     def get_embed_code(self, node):
         return "".join([line.strip() for line in self.parser.node_to_string(node).splitlines()])
 
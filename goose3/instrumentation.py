@@ -0,0 +1,111 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+# counter names
+BYTES_PARSED = "bytes_parsed"
+NODES_SCANNED = "nodes_scanned"
+XPATH_EVALUATIONS = "xpath_evaluations"
+CSS_EVALUATIONS = "css_evaluations"
+HTTP_REQUESTS = "http_requests"
+
+# the recorder of the extraction running in the current thread / task; None when instrumentation is disabled
+_RECORDER: ContextVar[Optional["Recorder"]] = ContextVar("goose3_recorder", default=None)
+
+
+def count(name: str, value: int = 1):
+    """Add to a counter of the extraction in progress; does nothing when instrumentation is disabled"""
+    recorder = _RECORDER.get()
+    if recorder is not None:
+        recorder.counters[name] = recorder.counters.get(name, 0) + value
+
+
+class Recorder:
+    """Wall and CPU time spent in each stage of an extraction along with the counters"""
+
+    def __init__(self):
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+
+    @contextmanager
+    def activate(self):
+        """Send the counts of the current thread / task to this recorder"""
+        token = _RECORDER.set(self)
+        try:
+            yield self
+        finally:
+            _RECORDER.reset(token)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as stage `name`; time spent in a stage run more than once is added up"""
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            timing = self.timings.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+            timing["wall"] += time.perf_counter() - wall
+            timing["cpu"] += time.thread_time() - cpu
+            timing["calls"] += 1
+
+
+class Aggregate:
+    """Totals of the timings and counters of all the instrumented extractions of the process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._articles = 0
+            self._timings: Dict[str, Dict[str, float]] = {}
+            self._counters: Dict[str, int] = {}
+
+    def add(self, recorder: Recorder):
+        with self._lock:
+            self._articles += 1
+            for name, timing in recorder.timings.items():
+                total = self._timings.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+                for key, value in timing.items():
+                    total[key] += value
+            for name, value in recorder.counters.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> dict:
+        """dict: A copy of the totals with the `articles`, `timings` and `counters` keys"""
+        with self._lock:
+            return {
+                "articles": self._articles,
+                "timings": {name: dict(timing) for name, timing in self._timings.items()},
+                "counters": dict(self._counters),
+            }
+
+
+# process wide totals
+GLOBAL_STATS = Aggregate()
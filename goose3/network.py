@@ -20,8 +20,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+
 import requests
 
+from goose3.instrumentation import HTTP_REQUESTS, count
+
 
 class NetworkError(RuntimeError):
     def __init__(self, status_code, reason):
@@ -51,6 +55,7 @@ class NetworkFetcher:
         return response.content
 
     def fetch_obj(self, url):
+        count(HTTP_REQUESTS)
         response = self._connection.get(
             url,
             timeout=self.config.http_timeout,
@@ -66,3 +71,115 @@ class NetworkFetcher:
                 raise NetworkError(response.status_code, response.reason)
 
         return response
+
+
+class AsyncNetworkFetcher:
+    """asyncio counterpart of the NetworkFetcher built on top of `httpx`
+
+    Note:
+        Blocking callers running in a worker thread (such as the image extraction) can use `fetch`; the request
+        is then run on the event loop the fetcher is bound to"""
+
+    def __init__(self, config, client=None):
+        try:
+            import httpx  # type: ignore
+        except ImportError as exc:
+            msg = "httpx is not installed. To use the asyncio api, one must install the httpx package"
+            raise ImportError(msg) from exc
+
+        self._httpx = httpx
+        self.config = config
+        self._owns_client = client is None
+        if client is None:
+            client = self._new_client()
+        else:
+            client.headers["User-agent"] = self.config.browser_user_agent
+        self._connection = client
+        self._url = None
+        self._loop = None
+        self._closer = None
+
+    def _new_client(self):
+        httpx = self._httpx
+        mounts = None
+        if self.config.http_proxies:
+            mounts = {
+                f"{scheme}://" if "://" not in scheme else scheme: httpx.AsyncHTTPTransport(proxy=proxy)
+                for scheme, proxy in self.config.http_proxies.items()
+            }
+        client = httpx.AsyncClient(
+            timeout=self.config.http_timeout,
+            auth=self.config.http_auth,
+            mounts=mounts,
+            follow_redirects=True,
+        )
+        client.headers["User-agent"] = self.config.browser_user_agent
+        return client
+
+    def bind_loop(self, loop):
+        """Set the event loop on which `fetch` schedules the requests of blocking callers; must be called from
+        within that loop
+
+        Note:
+            The pooled connections of a client belong to the loop they were opened on; when the loop changes, a
+            client built by the fetcher is replaced by a new one. Each client built by the fetcher is closed when
+            its loop shuts down its pending tasks, as `asyncio.run` does. A client given to the constructor is kept
+            as it is"""
+        if loop is self._loop:
+            return
+        if self._owns_client:
+            if self._loop is not None:
+                self._connection = self._new_client()
+            self._closer = loop.create_task(_close_at_shutdown(self._connection))
+        self._loop = loop
+
+    async def aclose(self):
+        if self._connection is not None:
+            await self._connection.aclose()
+            self._connection = None
+
+    def close(self):
+        """Drop the connection; use `aclose` from within the event loop to release it cleanly"""
+        self._connection = None
+
+    def get_url(self):
+        return self._url
+
+    async def afetch(self, url):
+        response = await self.afetch_obj(url)
+        return response.content
+
+    async def afetch_obj(self, url):
+        count(HTTP_REQUESTS)
+        response = await self._connection.get(url, headers=self.config.http_headers)
+        if response.is_success:
+            self._url = str(response.url)
+        else:
+            self._url = None
+            if self.config.strict:
+                raise NetworkError(response.status_code, response.reason_phrase)
+
+        return response
+
+    def fetch(self, url):
+        """Blocking fetch for callers that run in a worker thread while the bound event loop is running"""
+        if self._loop is None or not self._loop.is_running():
+            raise RuntimeError("AsyncNetworkFetcher.fetch requires a running event loop; see bind_loop")
+        if _running_loop() is self._loop:
+            raise RuntimeError("AsyncNetworkFetcher.fetch would block the event loop; use afetch instead")
+        return asyncio.run_coroutine_threadsafe(self.afetch(url), self._loop).result()
+
+
+async def _close_at_shutdown(client):
+    """Wait until cancelled, which is how `asyncio.run` ends the tasks left, then close the client"""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await client.aclose()
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
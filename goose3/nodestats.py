@@ -0,0 +1,166 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from goose3.text import StopWords
+
+
+def count_words(text: Optional[str]) -> int:
+    return len(text.split()) if text else 0
+
+
+class NodeStats:
+    """Text statistics of a single node: its text and the number of stop words of that text"""
+
+    __slots__ = ("text", "stopword_count")
+
+    def __init__(self, text: str, stopword_count: int):
+        self.text = text
+        self.stopword_count = stopword_count
+
+    @property
+    def text_length(self) -> int:
+        return len(self.text)
+
+
+class NodeStatistics:
+    """Per document table of the text statistics of the nodes, computed once per node and then looked up
+
+    The statistics describe the nodes as they were when first asked for; whoever changes the text of a node (removing,
+    moving or stripping elements) must clear the table before looking the node up again. Without stop words, the
+    stop words are not counted"""
+
+    def __init__(self, parser, stopwords: Optional[StopWords], language: Optional[str] = None):
+        self.parser = parser
+        self.stopwords = stopwords
+        self.language = language
+        self._stats: Dict = {}
+        # words, links and spaces in the text of the links of every node of the documents looked at
+        self._links: Dict = {}
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def get(self, node) -> NodeStats:
+        """The statistics of the node"""
+        stats = self._stats.get(node)
+        if stats is None:
+            text = self.parser.get_text(node)
+            stats = NodeStats(text, self.stopwords.count_stopwords(text) if self.stopwords is not None else 0)
+            self._stats[node] = stats
+        return stats
+
+    def add_many(self, nodes: Iterable):
+        """Compute the statistics of the nodes not looked up yet, counting the stop words of all of them at once"""
+        nodes = [node for node in dict.fromkeys(nodes) if node not in self._stats]
+        texts = [self.parser.get_text(node) for node in nodes]
+        counts = self.stopwords.count_stopwords_many(texts) if self.stopwords is not None else [0] * len(texts)
+        for node, text, stopword_count in zip(nodes, texts, counts):
+            self._stats[node] = NodeStats(text, stopword_count)
+
+    def link_stats(self, node) -> Tuple[int, int, int]:
+        """The number of words of the node, of links under it and of words of these links, counted the way
+        `ContentExtractor.is_highlink_density` splits the text of the node and the joined text of the links
+
+        The first lookup counts them for every node of the document at once"""
+        stats = self._links.get(node)
+        if stats is None:
+            # the top of the tree holding the node, which is not the root of the document when it was taken out of it
+            root = node
+            while root.getparent() is not None:
+                root = root.getparent()
+            self._count_links(root)
+            stats = self._links[node]
+        words, links, link_spaces = stats
+        # splitting an empty text still gives one word
+        return max(words, 1), links, link_spaces + 1
+
+    def _count_links(self, root):
+        """Count the words, links and spaces in the text of the links of every node from the ones of its children,
+        children first"""
+        links = self._links
+        for node in reversed(list(root.iter())):
+            # the text of comments and processing instructions is not part of the text of the node, their tail is
+            if not isinstance(node.tag, str):
+                links[node] = (0, 0, 0)
+                continue
+            words = count_words(node.text)
+            link_count = 0
+            link_spaces = 0
+            for child in node:
+                child_words, child_links, child_link_spaces = links[child]
+                words += child_words + count_words(child.tail)
+                link_count += child_links
+                link_spaces += child_link_spaces
+                if child.tag == "a":
+                    # the texts of the links are joined without a space in between
+                    link_count += 1
+                    link_spaces += max(child_words - 1, 0)
+            links[node] = (words, link_count, link_spaces)
+
+    def clear(self):
+        """Forget every node, after the document changed or once done with it"""
+        self._stats.clear()
+        self._links.clear()
+
+
+class GravityScores:
+    """Content scores of the nodes kept aside of the document, instead of the `gravityScore` and `gravityNodes`
+    attributes"""
+
+    def __init__(self):
+        self._scores: Dict = {}
+        self._counts: Dict = {}
+
+    def __contains__(self, node) -> bool:
+        return node in self._scores
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def get_score(self, node) -> Optional[int]:
+        """The score of the node; `None` if it was never scored"""
+        return self._scores.get(node)
+
+    def add_score(self, node, value: int):
+        self._scores[node] = self._scores.get(node, 0) + value
+
+    def get_count(self, node) -> Optional[int]:
+        """The number of scored nodes under the node; `None` if it was never scored"""
+        return self._counts.get(node)
+
+    def add_count(self, node, value: int):
+        self._counts[node] = self._counts.get(node, 0) + value
+
+    def discard(self, node):
+        """Forget the score and count of the node, as removing its attributes would"""
+        self._scores.pop(node, None)
+        self._counts.pop(node, None)
+
+    def copy_scores(self, source, copy):
+        """Give the nodes of a deep copy the scores of the nodes they were copied from, as the attributes would be"""
+        for original, copied in zip(source.iter(), copy.iter()):
+            if original in self._scores:
+                self._scores[copied] = self._scores[original]
+            if original in self._counts:
+                self._counts[copied] = self._counts[original]
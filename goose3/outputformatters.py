@@ -22,6 +22,7 @@ limitations under the License.
 
 import html
 
+from goose3.nodestats import NodeStatistics
 from goose3.text import inner_trim
 
 
@@ -42,6 +43,17 @@ class OutputFormatter:
         # top node
         self.top_node = None
 
+        # content extractor that scored the article
+        self.extractor = None
+
+    def reset(self, article):
+        """Bind the formatter to a new article so that it can be reused"""
+        self.parser = self.config.get_parser()
+        self.article = article
+        self.stopwords_class = self.config.stopwords_class
+        self.top_node = None
+        self.extractor = None
+
     def get_language(self):
         """
         Returns the language is by the article or
@@ -57,8 +69,14 @@ class OutputFormatter:
     def get_top_node(self):
         return self.top_node
 
-    def get_formatted_text(self):
+    def get_formatted_text(self, extractor=None):
+        """The text of the top node of the article, cleaned up
+
+        Args:
+            extractor (ContentExtractor): The content extractor that scored the article, the paragraphs are kept as
+                it weights them; defaults to the configured `content_extractor_class`"""
         self.top_node = self.article.top_node
+        self.extractor = extractor
         self.remove_negativescores_nodes()
         self.links_to_text()
         self.add_newline_to_br()
@@ -125,13 +143,26 @@ class OutputFormatter:
         """remove paragraphs that have less than x number of words, would indicate that it's some sort of link"""
         all_nodes = self.parser.get_elements_by_tags(self.get_top_node(), ["*"])
         all_nodes.reverse()
+        # the tags stripped above changed the text of the nodes, the table starts empty; a node is only looked up
+        # once all of its descendants were (and maybe removed) since they come first in reverse document order
+        language = self.get_language()
+        # the content extractor may weight the paragraphs by their length rather than their stop words
+        extractor = self.extractor or self.config.content_extractor_class
+        if extractor.stopword_scoring:
+            node_stats = NodeStatistics(self.parser, self.stopwords_class.for_language(language), language)
+        else:
+            node_stats = NodeStatistics(self.parser, None)
         for elm in all_nodes:
             tag = self.parser.get_tag(elm)
-            text = self.parser.get_text(elm)
-            stop_words = self.stopwords_class(language=self.get_language()).get_stopword_count(text)
+            stats = node_stats.get(elm)
+            text = stats.text
+            if extractor.stopword_scoring:
+                few_words = stats.stopword_count < 3
+            else:
+                few_words = stats.text_length < extractor.min_paragraph_score
             if (
                 (tag != "br" or text != "\\r")
-                and stop_words.get_stopword_count() < 3
+                and few_words
                 and len(self.parser.get_elements_by_tag(elm, tag="object")) == 0
                 and len(self.parser.get_elements_by_tag(elm, tag="embed")) == 0
             ):
@@ -139,8 +170,7 @@ class OutputFormatter:
             # TODO
             # check if it is in the right place
             else:
-                trimmed = self.parser.get_text(elm)
-                if trimmed.startswith("(") and trimmed.endswith(")"):
+                if text.startswith("(") and text.endswith(")"):
                     self.parser.remove(elm)
 
 
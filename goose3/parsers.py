@@ -20,23 +20,75 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
 from copy import deepcopy
 
 import lxml.html
 from lxml import etree
-
+from lxml.cssselect import CSSSelector
+from lxml.html import defs
+
+from goose3.instrumentation import (
+    BYTES_PARSED,
+    CSS_EVALUATIONS,
+    XPATH_EVALUATIONS,
+    count,
+)
 from goose3.text import encode_value, get_encodings_from_content, inner_trim, smart_str
 from goose3.utils import deprecated
 from goose3.utils.constants import CAMEL_CASE_DEPRICATION
 
+# tags the html parser reads back differently from the tree they come from: blocks end a paragraph, the
+# content of scripts and styles is not unescaped, a meta may set the charset
+REPARSED_TAGS = frozenset(defs.block_tags | {"script", "style", "meta"})
+
+
+# compiled XPath expressions kept by `compile_xpath`
+XPATH_CACHE_SIZE = 256
+
+XPATH_NAMESPACES = {"re": "http://exslt.org/regular-expressions"}
+
+
+@functools.lru_cache(maxsize=XPATH_CACHE_SIZE)
+def compile_xpath(expression):
+    """The compiled XPath expression, the `re` prefix bound to the EXSLT regular expressions
+
+    Kept in a bounded LRU cache so that libxml does not compile the expression again on each evaluation"""
+    return etree.XPath(expression, namespaces=XPATH_NAMESPACES)
+
+
+def evaluate_xpath(node, expression, **variables):
+    """Evaluate the XPath expression from the node, compiled once through `compile_xpath`"""
+    if isinstance(node.tag, str):
+        return compile_xpath(expression)(node, **variables)
+    # a comment or a processing instruction can not be the context of a compiled expression
+    return node.xpath(expression, namespaces=XPATH_NAMESPACES, **variables)
+
+
+# compiled CSS selectors kept by `compile_css`
+CSS_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=CSS_CACHE_SIZE)
+def compile_css(selector):
+    """The CSS selector translated to XPath and compiled, as `HtmlElement.cssselect` does on each call
+
+    Kept in a bounded LRU cache, shared by the threads and the parsers"""
+    return CSSSelector(selector, translator="html")
+
 
 class Parser:
     @classmethod
     def xpath_re(cls, node, expression):
-        regexp_namespace = "http://exslt.org/regular-expressions"
-        items = node.xpath(expression, namespaces={"re": regexp_namespace})
+        count(XPATH_EVALUATIONS)
+        items = evaluate_xpath(node, expression)
         return items
 
+    @classmethod
+    def xpath_cache_info(cls):
+        """The hits, misses and size of the cache of compiled XPath expressions"""
+        return compile_xpath.cache_info()
+
     @classmethod
     def drop_tag(cls, nodes):
         if isinstance(nodes, list):
@@ -47,17 +99,28 @@ class Parser:
 
     @classmethod
     def css_select(cls, node, selector):
+        count(CSS_EVALUATIONS)
+        if isinstance(node.tag, str):
+            return compile_css(selector)(node)
+        # a comment or a processing instruction can not be the context of a compiled selector
         return node.cssselect(selector)
 
+    @classmethod
+    def css_cache_info(cls):
+        """The hits, misses and size of the cache of compiled CSS selectors"""
+        return compile_css.cache_info()
+
     @classmethod
     def fromstring(cls, html):
         encoding = get_encodings_from_content(html)
         encoding = encoding[0] if encoding else None
         if not encoding:
             html = encode_value(html)
+            count(BYTES_PARSED, len(html))
             doc = lxml.html.fromstring(html)
         else:
             html = smart_str(html, encoding=encoding)
+            count(BYTES_PARSED, len(html))
             parser = lxml.html.HTMLParser(encoding=encoding)
             doc = lxml.html.fromstring(html, parser=parser)
         return doc
@@ -77,6 +140,7 @@ class Parser:
     @classmethod
     def get_element_by_id(cls, node, idd):
         selector = f'//*[@id="{idd}"]'
+        count(XPATH_EVALUATIONS)
         elems = node.xpath(selector)
         if elems:
             return elems[0]
@@ -84,17 +148,16 @@ class Parser:
 
     @classmethod
     def get_elements_by_tag(cls, node, tag=None, attr=None, value=None, childs=False):
-        namespace = "http://exslt.org/regular-expressions"
         sel = tag or "*"
-        selector = f"descendant-or-self::{sel}"
+        # the node itself is left out when selecting a tag or the children
+        axis = "descendant" if tag or childs else "descendant-or-self"
+        selector = f"{axis}::{sel}"
+        count(XPATH_EVALUATIONS)
         if attr and value:
-            selector = f'{selector}[re:test(@{attr}, "{value}", "i")]'
-        elems = node.xpath(selector, namespaces={"re": namespace})
-        # remove the root node
-        # if we have a selection tag
-        if node in elems and (tag or childs):
-            elems.remove(node)
-        return elems
+            # the value is a variable so that the compiled expression serves all the values
+            selector = f'{selector}[re:test(@{attr}, $value, "i")]'
+            return evaluate_xpath(node, selector, value=value)
+        return evaluate_xpath(node, selector)
 
     @classmethod
     def append_child(cls, node, child):
@@ -106,26 +169,21 @@ class Parser:
 
     @classmethod
     def child_nodes_with_text(cls, node):
-        root = node
+        """The children of the node with its text and the tail of each child as `text` elements
+
+        The `text` elements are not inserted in the node, the node is left unchanged"""
+        nodes = []
         # create the first text node
         # if we have some text in the node
-        if root.text:
-            elm = lxml.html.HtmlElement()
-            elm.text = root.text
-            elm.tag = "text"
-            root.text = None
-            root.insert(0, elm)
+        if node.text:
+            nodes.append(cls.create_element(tag="text", text=node.text))
         # loop childs
-        for _, elm in enumerate(list(root)):
-            idx = root.index(elm)
-            # don't process texts nodes
-            if elm.tag == "text":
-                continue
+        for elm in node:
+            nodes.append(elm)
             # create a text node for tail
-            if elm.tail:
-                tmp = cls.create_element(tag="text", text=elm.tail, tail=None)
-                root.insert(idx + 1, tmp)
-        return list(root)
+            if elm.tail and elm.tag != "text":
+                nodes.append(cls.create_element(tag="text", text=elm.tail))
+        return nodes
 
     @classmethod
     def text_to_para(cls, text):
@@ -134,6 +192,50 @@ class Parser:
         except etree.ParserError:
             return etree.Element("empty")
 
+    @classmethod
+    def nodes_to_para(cls, nodes):
+        """Build the paragraph of a run of texts and elements without going through html
+
+        Gives the tree `text_to_para` parses out of `nodes_to_html`: a `p` when the run starts with some text,
+        a `span` when it starts with an element, the element itself when it is alone. Runs the html parser
+        would read differently (markup characters in the texts, blocks or raw text elements in the elements)
+        still go through `text_to_para`. The elements are moved in the paragraph."""
+        for node in nodes:
+            if isinstance(node, str):
+                if "<" in node or "&" in node:
+                    return cls.text_to_para(cls.nodes_to_html(nodes))
+            elif any(not isinstance(elm.tag, str) or elm.tag in REPARSED_TAGS for elm in node.iter()):
+                return cls.text_to_para(cls.nodes_to_html(nodes))
+
+        first = nodes[0]
+        if not isinstance(first, str) and len(nodes) == 1:
+            first.tail = " "
+            return first
+
+        para = cls.create_element(tag="p" if isinstance(first, str) else "span")
+        last = None
+        for node in nodes:
+            if isinstance(node, str):
+                if last is None:
+                    para.text = (para.text or "") + node
+                else:
+                    last.tail += node
+            else:
+                # elements are surrounded by spaces, but for the leading one
+                if last is not None:
+                    last.tail += " "
+                elif para.text is not None:
+                    para.text += " "
+                node.tail = " "
+                para.append(node)
+                last = node
+        return para
+
+    @classmethod
+    def nodes_to_html(cls, nodes):
+        """The html of a run of texts and elements, the elements surrounded by spaces"""
+        return "".join(node if isinstance(node, str) else " " + cls.outer_html(node) + " " for node in nodes)
+
     @classmethod
     def get_children(cls, node):
         return node.getchildren()
@@ -158,6 +260,7 @@ class Parser:
 
     @classmethod
     def get_comments(cls, node):
+        count(XPATH_EVALUATIONS)
         return node.xpath("//comment()")
 
     @classmethod
@@ -372,5 +475,11 @@ class ParserSoup(Parser):
         from lxml.html import soupparser
 
         html = encode_value(html)
+        count(BYTES_PARSED, len(html))
         doc = soupparser.fromstring(html)
         return doc
+
+    @classmethod
+    def nodes_to_para(cls, nodes):
+        # the paragraphs are what beautifulsoup makes of the html
+        return cls.text_to_para(cls.nodes_to_html(nodes))
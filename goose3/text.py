@@ -23,8 +23,9 @@ limitations under the License.
 import os
 import re
 import string
+import threading
 import warnings
-from typing import Dict, Set
+from typing import Dict, Iterable, List, Set, Tuple
 import unicodedata
 
 from goose3.utils import FileHelper, deprecated
@@ -33,6 +34,7 @@ from goose3.utils.encoding import DjangoUnicodeDecodeError, smart_str, smart_uni
 
 SPACE_SYMBOLS = re.compile(r"[\s\xa0\t]")
 TABSSPACE = re.compile(r"[\s\t]+")
+PUNCTUATION_TABLE = dict.fromkeys(ord(x) for x in string.punctuation)
 
 
 def get_encodings_from_content(content):
@@ -115,17 +117,43 @@ class WordStats:
 
 class StopWords:
     _cached_stop_words: Dict[str, Set[str]] = {}
+    # ready to use instances per class and language, see for_language
+    _instances: Dict[Tuple[type, str], "StopWords"] = {}
+    _lock = threading.RLock()
 
     def __init__(self, language="en"):
         if language not in self._cached_stop_words:
-            path = os.path.join("resources", "text", f"stopwords-{language}.txt")
-            try:
-                content = FileHelper.load_resource_file(path)
-                word_list = content.splitlines()
-            except OSError:
-                word_list = []
-            self._cached_stop_words[language] = set(word_list)
+            with self._lock:
+                if language not in self._cached_stop_words:
+                    path = os.path.join("resources", "text", f"stopwords-{language}.txt")
+                    try:
+                        content = FileHelper.load_resource_file(path)
+                        word_list = content.splitlines()
+                    except OSError:
+                        word_list = []
+                    self._cached_stop_words[language] = set(word_list)
         self._stop_words = self._cached_stop_words[language]
+        # the words are those of the whitespace split, the counting can skip WordStats
+        self._empty_stop_word = "" in self._stop_words
+        cls = type(self)
+        self._fast_count = (
+            cls.get_stopword_count is StopWords.get_stopword_count and cls.candidate_words is StopWords.candidate_words
+        )
+
+    @classmethod
+    def for_language(cls, language="en"):
+        """The instance of the class for the language shared by the whole process, built on first use
+
+        The counting does not change the instance so that it can be used by several threads at once"""
+        key = (cls, language)
+        instance = cls._instances.get(key)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(key)
+                if instance is None:
+                    instance = cls(language=language)
+                    cls._instances[key] = instance
+        return instance
 
     @staticmethod
     def remove_punctuation(content):
@@ -133,8 +161,7 @@ class StopWords:
         # http://stackoverflow.com/questions/265960/best-way-to-strip-punctuation-from-a-string-in-python
         if not isinstance(content, str):
             content = content.decode("utf-8")
-        tbl = dict.fromkeys(ord(x) for x in string.punctuation)
-        return content.translate(tbl)
+        return content.translate(PUNCTUATION_TABLE)
 
     @staticmethod
     def candidate_words(stripped_input):
@@ -150,14 +177,45 @@ class StopWords:
         i = 0
         for word in candidate_words:
             i += 1
-            if word.lower() in self._stop_words:
-                overlapping_stopwords.append(word.lower())
+            word = word.lower()
+            if word in self._stop_words:
+                overlapping_stopwords.append(word)
 
         stats.set_word_count(i)
         stats.set_stopword_count(len(overlapping_stopwords))
         stats.set_stop_words(overlapping_stopwords)
         return stats
 
+    def count_stopwords(self, content) -> int:
+        """The number of stop words of the content, as `get_stopword_count(content).get_stopword_count()` without
+        building the list of the stop words found"""
+        if not content:
+            return 0
+        if not self._fast_count:
+            return self.get_stopword_count(content).get_stopword_count()
+        return self._count(self.remove_punctuation(content).lower())
+
+    def count_stopwords_many(self, contents: Iterable[str]) -> List[int]:
+        """`count_stopwords` of each of the contents; the punctuation is removed and the case lowered for all of them
+        at once"""
+        contents = [content.decode("utf-8") if isinstance(content, bytes) else content or "" for content in contents]
+        if not contents:
+            return []
+        # the contents are joined on a character no html text holds
+        if not self._fast_count or any("\0" in content for content in contents):
+            return [self.count_stopwords(content) for content in contents]
+        texts = self.remove_punctuation("\0".join(contents)).lower().split("\0")
+        return [self._count(text) if content else 0 for content, text in zip(contents, texts)]
+
+    def _count(self, text: str) -> int:
+        """The number of stop words of a text without punctuation and in lower case"""
+        words = text.split()
+        count = sum(map(self._stop_words.__contains__, words))
+        if self._empty_stop_word:
+            # splitting on every space gives an empty word between two consecutive ones
+            count += len(text) - sum(map(len, words)) + 1 - len(words)
+        return count
+
 
 class StopWordsChinese(StopWords):
     """Chinese segmentation"""
@@ -207,16 +265,24 @@ class StopWordsArabic(StopWords):
 class StopWordsKorean(StopWords):
     """Korean segmentation"""
 
+    # automatons built from the stop words, per language
+    _automatons: Dict[str, object] = {}
+
     def __init__(self, language="ko"):
         super().__init__(language="ko")
         # Korean StopWords are attached at noun without a space
         # To find the stopwords in given sentences quickly, Ahocorasick is needed
-        import ahocorasick  # type: ignore
-
-        self.auto = ahocorasick.Automaton()
-        for word in self._stop_words:
-            self.auto.add_word(word, word)
-        self.auto.make_automaton()
+        if "ko" not in self._automatons:
+            with self._lock:
+                if "ko" not in self._automatons:
+                    import ahocorasick  # type: ignore
+
+                    auto = ahocorasick.Automaton()
+                    for word in self._stop_words:
+                        auto.add_word(word, word)
+                    auto.make_automaton()
+                    self._automatons["ko"] = auto
+        self.auto = self._automatons["ko"]
 
     def get_stopword_count(self, content):
         if not content:
@@ -21,6 +21,7 @@ limitations under the License.
 """
 
 import functools
+import hashlib
 import pkgutil
 import time
 import typing
@@ -49,16 +50,16 @@ class ParsingCandidate:
 
 class RawHelper:
     @classmethod
-    def get_parsing_candidate(cls, url: str, raw_html: str) -> ParsingCandidate:
+    def get_parsing_candidate(cls, url: str, raw_html: str, algorithm: str = "blake2b") -> ParsingCandidate:
         if isinstance(raw_html, str):
             raw_html = raw_html.encode("utf-8")
-        link_hash = f"{fnv_1a(raw_html)}.{time.time()}"
+        link_hash = f"{fingerprint(raw_html, algorithm)}.{time.time()}"
         return ParsingCandidate(url, link_hash)
 
 
 class URLHelper:
     @classmethod
-    def get_parsing_candidate(cls, url_to_crawl: str) -> ParsingCandidate:
+    def get_parsing_candidate(cls, url_to_crawl: str, algorithm: str = "blake2b") -> ParsingCandidate:
         # replace shebang is urls
         if "#!" in url_to_crawl:
             final_url = url_to_crawl.replace("#!", "?_escaped_fragment_=")
@@ -68,7 +69,7 @@ class URLHelper:
         # url is only for calculating the link_hash
         url = final_url.encode("utf-8") if isinstance(final_url, str) else final_url
 
-        link_hash = f"{fnv_1a(url)}.{time.time()}"
+        link_hash = f"{fingerprint(url, algorithm)}.{time.time()}"
         return ParsingCandidate(final_url, link_hash)
 
 
@@ -128,6 +129,38 @@ def fnv_1a(key: KeyT, seed: int = 0) -> str:
     return hex(hval)[2:]
 
 
+def blake2b_hash(key: KeyT) -> str:
+    """64 bit blake2b hash; unlike `fnv_1a` the bytes are hashed in C, which matters for whole html documents
+    Args:
+        key (str): The element to be hashed; strings are utf-8 encoded
+    Returns:
+        str: 64-bit hashed representation of key"""
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+# the hash functions available to fingerprint documents and image urls
+FINGERPRINT_ALGORITHMS: typing.Dict[str, typing.Callable[[KeyT], str]] = {
+    "blake2b": blake2b_hash,
+    "fnv_1a": fnv_1a,
+}
+
+
+def fingerprint(key: KeyT, algorithm: str = "blake2b") -> str:
+    """Hash the key using one of the `FINGERPRINT_ALGORITHMS`
+    Args:
+        key (str): The element to be hashed
+        algorithm (str): The name of the hash function; `fnv_1a` gives the values of previous versions
+    Returns:
+        str: hashed representation of key"""
+    try:
+        func = FINGERPRINT_ALGORITHMS[algorithm]
+    except KeyError as exc:
+        raise ValueError(f"Unknown fingerprint algorithm: {algorithm}") from exc
+    return func(key)
+
+
 def deprecated(message: str = "") -> typing.Callable:
     """A simplistic decorator to mark functions as deprecated. The function
     will pass a message to the user on the first use of the function
@@ -27,7 +27,7 @@ import os
 from PIL import Image
 
 from goose3.image import ImageDetails, LocallyStoredImage
-from goose3.utils import fnv_1a
+from goose3.utils import fingerprint
 from goose3.utils.encoding import smart_str
 
 logger = logging.getLogger(__name__)
@@ -119,7 +119,7 @@ class ImageUtils:
 
     @classmethod
     def get_localfile_name(cls, link_hash, src, config):
-        image_hash = fnv_1a(smart_str(src))
+        image_hash = fingerprint(smart_str(src), config.fingerprint_algorithm)
         return os.path.join(config.local_storage_path, f"{link_hash}_{image_hash}")
 
     @classmethod
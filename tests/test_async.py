@@ -0,0 +1,146 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from goose3 import Goose
+from goose3.network import AsyncNetworkFetcher, NetworkError
+
+from .test_base import load_content
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncExtract(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.html = load_content("test_cnn1")
+        with Goose() as g:
+            self.expected = g.extract(raw_html=self.html).cleaned_text
+
+    def mock_fetcher(self, config, status_code=200):
+        def handler(request):
+            return httpx.Response(status_code, content=self.html.encode("utf-8"), headers={"Content-Type": "text/html"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncNetworkFetcher(config, client=client)
+
+    async def test_aextract_raw_html(self):
+        async with Goose() as g:
+            article = await g.aextract(raw_html=self.html)
+        self.assertEqual(article.cleaned_text, self.expected)
+
+    async def test_aextract_deadline(self):
+        async with Goose() as g:
+            article = await g.aextract(raw_html=self.html, deadline=-1)
+            self.assertTrue(article.deadline_exceeded)
+            article = await g.aextract(raw_html=self.html, deadline=60)
+        self.assertFalse(article.deadline_exceeded)
+        self.assertEqual(article.cleaned_text, self.expected)
+
+    async def test_aextract_url(self):
+        async with Goose() as g:
+            g.async_fetcher = self.mock_fetcher(g.config)
+            article = await g.aextract(url="http://www.cnn.com/article.html")
+        self.assertEqual(article.cleaned_text, self.expected)
+        self.assertEqual(article.final_url, "http://www.cnn.com/article.html")
+
+    async def test_aextract_instrumentation(self):
+        async with Goose({"enable_instrumentation": True}) as g:
+            g.async_fetcher = self.mock_fetcher(g.config)
+            article = await g.aextract(url="http://www.cnn.com/article.html")
+        self.assertEqual(article.counters["http_requests"], 1)
+        self.assertIn("fetch", article.timings)
+        self.assertIn("formatter", article.timings)
+
+    async def test_aextract_network_error(self):
+        async with Goose() as g:
+            g.async_fetcher = self.mock_fetcher(g.config, status_code=404)
+            with self.assertRaises(NetworkError):
+                await g.aextract(url="http://www.cnn.com/missing.html")
+
+    async def test_blocking_fetch_from_loop(self):
+        async with Goose() as g:
+            fetcher = self.mock_fetcher(g.config)
+            g.async_fetcher = fetcher
+            await g.aextract(raw_html=self.html)
+            with self.assertRaises(RuntimeError):
+                fetcher.fetch("http://www.cnn.com/image.jpg")
+
+    async def test_blocking_fetch_from_thread(self):
+        async with Goose() as g:
+            fetcher = self.mock_fetcher(g.config)
+            g.async_fetcher = fetcher
+            await g.aextract(raw_html=self.html)
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, fetcher.fetch, "http://www.cnn.com/image.jpg")
+        self.assertEqual(content, self.html.encode("utf-8"))
+
+    async def test_aextract_requires_input(self):
+        async with Goose() as g:
+            with self.assertRaises(ValueError):
+                await g.aextract()
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncExtractLoops(unittest.TestCase):
+    def setUp(self):
+        html = load_content("test_cnn1")
+        handler = type("Handler", (KeepAliveHandler,), {"body": html.encode("utf-8")})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/article.html"
+        with Goose() as g:
+            self.expected = g.extract(raw_html=html).cleaned_text
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_successive_event_loops(self):
+        with Goose() as g:
+            first = asyncio.run(g.aextract(url=self.url))
+            second = asyncio.run(g.aextract(url=self.url))
+        self.assertEqual(first.cleaned_text, self.expected)
+        self.assertEqual(second.cleaned_text, self.expected)
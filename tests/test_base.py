@@ -45,6 +45,10 @@ def load_resource(path):
         raise OSError("Couldn't open file %s" % path)
 
 
+def load_content(name):
+    return load_resource(os.path.join(CURRENT_PATH, "data", "content", f"{name}.html"))
+
+
 def fail_after(version, method=None):
     """Decorator to add to tests to ensure that they fail if a deprecated
     feature is not removed before the specified version
@@ -0,0 +1,75 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from goose3 import Goose
+
+from .test_base import load_content
+
+
+class TestExtractMany(unittest.TestCase):
+    names = ["test_cnn1", "test_espn", "test_issue4", "test_time2", "test_yahoo"]
+
+    def setUp(self):
+        self.htmls = [load_content(name) for name in self.names]
+        with Goose() as g:
+            self.expected = [g.extract(raw_html=html).cleaned_text for html in self.htmls]
+
+    def test_ordered(self):
+        items = [{"raw_html": html} for html in self.htmls]
+        with Goose() as g:
+            results = list(g.extract_many(items, workers=2, ordered=True, max_in_flight=2))
+        self.assertEqual([res.index for res in results], list(range(len(items))))
+        self.assertTrue(all(res.ok for res in results))
+        self.assertEqual([res.article.cleaned_text for res in results], self.expected)
+
+    def test_unordered(self):
+        items = [{"raw_html": html} for html in self.htmls]
+        with Goose() as g:
+            results = list(g.extract_many(items, workers=2))
+        self.assertEqual(sorted(res.index for res in results), list(range(len(items))))
+        for res in results:
+            self.assertEqual(res.article.cleaned_text, self.expected[res.index])
+            self.assertIsNone(res.article.doc)
+            self.assertIsNone(res.article.top_node)
+
+    def test_invalid_sizes(self):
+        items = [{"raw_html": self.htmls[0]}]
+        with Goose() as g:
+            for value in (0, -1):
+                with self.assertRaises(ValueError):
+                    list(g.extract_many(items, workers=value))
+                with self.assertRaises(ValueError):
+                    list(g.extract_many(items, workers=1, max_in_flight=value))
+
+    def test_errors_are_captured(self):
+        items = [{"raw_html": self.htmls[0]}, {}, 12, {"raw_html": self.htmls[1]}]
+        with Goose() as g:
+            results = list(g.extract_many(items, workers=2, ordered=True))
+        self.assertEqual(len(results), 4)
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertIsInstance(results[2].error, TypeError)
+        self.assertIsNone(results[2].article)
+        self.assertIsNone(results[2].url)
+        self.assertEqual(results[3].article.cleaned_text, self.expected[1])
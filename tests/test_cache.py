@@ -0,0 +1,164 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+from goose3 import Goose
+from goose3.cache import MemoryCache, ResultCache, SQLiteCache, TieredCache, cache_key
+from goose3.configuration import Configuration
+
+from .test_base import CURRENT_PATH, load_resource
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        self.assertEqual(cache.get("a"), b"1234")  # a is now the most recently used
+        cache.set("c", b"1234")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1234")
+        self.assertEqual(cache.get("c"), b"1234")
+        self.assertEqual(cache.size, 8)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.stats.hits, 3)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_value_too_large(self):
+        cache = MemoryCache(max_bytes=2)
+        self.assertFalse(cache.set("a", b"123"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.stores, 0)
+        self.assertTrue(cache.set("b", b"12"))
+        self.assertEqual(cache.stats.stores, 1)
+
+    def test_concurrent_stats(self):
+        cache = MemoryCache()
+        cache.set("a", b"1")
+
+        def lookup():
+            for _ in range(1000):
+                cache.get("a")
+                cache.get("b")
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cache.stats.hits, 8000)
+        self.assertEqual(cache.stats.misses, 8000)
+
+    def test_incomplete_subclass(self):
+        class GetOnlyCache(ResultCache):
+            def _get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnlyCache()
+
+    def test_copies_are_empty(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"1")
+        other = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(other.max_bytes, 10)
+        self.assertIsNone(other.get("a"))
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache", "results.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_shared_between_instances(self):
+        SQLiteCache(self.path).set("a", b"123")
+        other = pickle.loads(pickle.dumps(SQLiteCache(self.path)))
+        self.assertEqual(other.get("a"), b"123")
+        other.clear()
+        self.assertIsNone(other.get("a"))
+
+    def test_max_age(self):
+        cache = SQLiteCache(self.path, max_age=-1)
+        cache.set("a", b"123")
+        self.assertIsNone(cache.get("a"))
+
+    def test_tiered(self):
+        memory = MemoryCache()
+        cache = TieredCache(memory, SQLiteCache(self.path))
+        TieredCache(SQLiteCache(self.path)).set("a", b"123")
+        self.assertEqual(cache.get("a"), b"123")
+        # promoted to the memory tier
+        self.assertEqual(memory.get("a"), b"123")
+        self.assertEqual(cache.stats.hits, 1)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.html = load_resource(os.path.join(CURRENT_PATH, "data", "content", "test_cnn1.html"))
+
+    def test_extract_from_cache(self):
+        cache = MemoryCache()
+        with Goose({"result_cache": cache}) as g:
+            first = g.extract(raw_html=self.html)
+            second = g.extract(raw_html=self.html)
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.infos, second.infos)
+        self.assertEqual(first.top_node_raw_html, second.top_node_raw_html)
+        self.assertIsNotNone(first.top_node)
+        self.assertIsNone(second.top_node)
+        self.assertIsNotNone(second.raw_doc)
+        # each extraction has its own link hash
+        self.assertNotEqual(first.link_hash, second.link_hash)
+        self.assertEqual(first.link_hash.split(".")[0], second.link_hash.split(".")[0])
+
+    def test_key(self):
+        config = Configuration()
+        key = cache_key(config, self.html)
+        self.assertEqual(key, cache_key(Configuration(), self.html))
+        self.assertNotEqual(key, cache_key(config, self.html + " "))
+        self.assertNotEqual(key, cache_key(config, self.html, url="http://www.cnn.com/"))
+        self.assertNotEqual(key, cache_key(config, self.html, stages={"title"}))
+        config.http_timeout = 5
+        self.assertEqual(key, cache_key(config, self.html))
+        config.target_language = "fr"
+        self.assertNotEqual(key, cache_key(config, self.html))
+        key = cache_key(config, self.html)
+        config.fingerprint_algorithm = "fnv_1a"
+        self.assertNotEqual(key, cache_key(config, self.html))
+
+    def test_fields_are_part_of_the_key(self):
+        cache = MemoryCache()
+        with Goose({"result_cache": cache}) as g:
+            g.extract(raw_html=self.html, fields={"title"})
+            article = g.extract(raw_html=self.html)
+        self.assertEqual(cache.stats.hits, 0)
+        self.assertNotEqual(article.cleaned_text, "")
@@ -0,0 +1,97 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from goose3 import Configuration
+from goose3.article import Article
+from goose3.cleaners import BLOCK_TAGS, StandardDocumentCleaner
+from goose3.instrumentation import Recorder
+from goose3.parsers import Parser
+
+
+class SelectingDocumentCleaner(StandardDocumentCleaner):
+    """Looks for the block tags under each node, as div_to_para used to"""
+
+    def block_holders(self, doc):
+        return {node for node in doc.iter() if self.parser.get_elements_by_tags(node, list(BLOCK_TAGS))}
+
+
+class HtmlFlushDocumentCleaner(StandardDocumentCleaner):
+    """Builds the paragraphs of texts and links by parsing their html, as get_replacement_nodes used to"""
+
+    def get_flushed_nodes(self, replacement_nodes):
+        return self.get_flushed_buffer(self.parser.nodes_to_html(replacement_nodes))
+
+
+def nested_document(depth, width):
+    """`width` stacks of `depth` nested divs and spans, with text, links and paragraphs at different levels"""
+    stacks = []
+    for i in range(width):
+        html = f"<p>leaf {i} with a <a href='#'>link</a></p>" if i % 2 else f"leaf {i} <b>bold</b> text"
+        for level in range(depth):
+            tag = "span" if level % 3 == 1 else "div"
+            extra = " <a href='#'>nav</a> \n\n tail text" if level % 4 == 0 else ""
+            html = f"<{tag}>level {level} text{extra}{html}</{tag}> after {level}"
+        stacks.append(html)
+    return "<html><body>" + "".join(stacks) + "</body></html>"
+
+
+class TestDivToPara(unittest.TestCase):
+    def setUp(self):
+        self.config = Configuration()
+
+    def div_to_para(self, cleaner_class, html):
+        doc = Parser.fromstring(html)
+        cleaner = cleaner_class(self.config, Article())
+        recorder = Recorder()
+        with recorder.activate():
+            cleaner.div_to_para(doc, "div")
+            cleaner.div_to_para(doc, "span")
+        return Parser.nodeToString(doc), recorder.counters
+
+    def test_same_as_selecting_under_each_node(self):
+        for depth, width in [(1, 1), (5, 3), (20, 4)]:
+            html = nested_document(depth, width)
+            result, _ = self.div_to_para(StandardDocumentCleaner, html)
+            expected, _ = self.div_to_para(SelectingDocumentCleaner, html)
+            self.assertEqual(result, expected)
+
+    def test_links_without_reparsing(self):
+        html = (
+            "<html><body><div>intro text <a href='1'>one</a> middle <b>bold</b> tail <a href='2'>two</a>"
+            "<a href='3'>three <i>i</i></a> end<p>para</p>after para</div>"
+            "<div><a href='4'>four</a> text<p>p</p> more <a href='5'>five</a></div></body></html>"
+        )
+        result, counters = self.div_to_para(StandardDocumentCleaner, html)
+        self.assertNotIn("bytes_parsed", counters)
+        self.assertEqual(result, self.div_to_para(HtmlFlushDocumentCleaner, html)[0])
+
+    def test_scaling(self):
+        # one selection per pass whatever the size of the document, where selecting the block tags under
+        # each node goes over the subtree of each of the nested nodes
+        for width in [1, 10, 50]:
+            _, counters = self.div_to_para(StandardDocumentCleaner, nested_document(20, width))
+            self.assertEqual(counters.get("css_evaluations", 0), 0)
+            self.assertEqual(counters["xpath_evaluations"], 2)
+            _, counters = self.div_to_para(SelectingDocumentCleaner, nested_document(20, width))
+            self.assertGreater(counters["css_evaluations"], 20 * width)
@@ -20,8 +20,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from goose3 import ArticleContextPattern
-from goose3.text import StopWordsArabic, StopWordsChinese, StopWordsKorean
+import re
+import unittest
+
+from goose3 import ArticleContextPattern, Goose
+from goose3.article import Article
+from goose3.cleaners import SinglePassDocumentCleaner, StandardDocumentCleaner
+from goose3.extractors import content
+from goose3.extractors.content import VectorizedContentExtractor
+from goose3.parsers import Parser
+from goose3.text import StopWords, StopWordsArabic, StopWordsChinese, StopWordsKorean
 
 from .test_base import TestExtractionBase
 
@@ -276,6 +284,45 @@ class TestExtractions(TestExtractionBase):
         fields = ["cleaned_text"]
         self.runArticleAssertions(article=article, fields=fields)
 
+    def test_remove_nodes_patterns(self):
+        paragraph = "<p>This is a paragraph of the story and it has more than enough words in it to count.</p>"
+        promo = paragraph.replace("story", "promo")
+        promo = "<div class='Newsletter-Signup'>" + promo + "</div>"
+        html = "<html><body><div>" + paragraph + promo + paragraph * 2 + "</div></body></html>"
+        config = self.getConfig()
+        with Goose(config) as g:
+            self.assertIn("promo", g.extract(raw_html=html).cleaned_text)
+        config.remove_nodes_patterns = "^newsletter-signup$"
+        with Goose(config) as g:
+            self.assertNotIn("promo", g.extract(raw_html=html).cleaned_text)
+
+        with self.assertRaises(ValueError):
+            config.remove_nodes_patterns = ["(unbalanced"]
+        # the patterns only change through the property, which checks them
+        with self.assertRaises(AttributeError):
+            config.remove_nodes_patterns.append("(unbalanced")
+        self.assertEqual(config.remove_nodes_patterns, ("^newsletter-signup$",))
+
+    def test_stopwords_counted_once_per_node(self):
+        counted = []
+
+        class CountingStopWords(StopWords):
+            def get_stopword_count(self, content):
+                counted.append(content)
+                return super().get_stopword_count(content)
+
+        paragraph = "<p>Paragraph {} with the words of the language and a <a href='#'>link</a> in the middle of it.</p>"
+        body = "".join(paragraph.format(i) for i in range(60))
+        html = f"<html><body><div><div class='article'>{body}</div><p>a sibling of the article</p></div></body></html>"
+        with Goose({"stopwords_class": CountingStopWords}) as g:
+            article = g.extract(raw_html=html)
+        self.assertTrue(article.cleaned_text.startswith("Paragraph 0 with"))
+        # once by the scoring (reused by the post cleanup) and once by the formatter
+        self.assertEqual(
+            counted.count("Paragraph 30 with the words of the language and a link in the middle of it."), 2
+        )
+        self.assertLess(len(counted), 3 * 60)
+
 
 class TestArticleTopNode(TestExtractionBase):
     def test_articlebody_itemprop(self):
@@ -294,6 +341,167 @@ class TestArticleTopNode(TestExtractionBase):
         self.runArticleAssertions(article=article, fields=fields)
 
 
+class TestArticleTopNodeLazyRawDoc(TestArticleTopNode):
+    def getConfig(self):
+        config = super().getConfig()
+        config.lazy_raw_doc = True
+        return config
+
+    def test_raw_doc_is_parsed_on_access(self):
+        html = (
+            "<html><body><article><p>This is the article and it is long enough to be one.</p></article></body></html>"
+        )
+        with Goose(self.getConfig()) as g:
+            article = g.extract(raw_html=html)
+        self.assertIsNone(article._raw_doc)
+        raw_doc = article.raw_doc
+        self.assertIsNotNone(raw_doc)
+        self.assertIs(article.raw_doc, raw_doc)
+        self.assertEqual(len(raw_doc.xpath("//article")), 1)
+
+
+class TestExtractionsLazyRawDoc(TestExtractions):
+    def getConfig(self):
+        config = super().getConfig()
+        config.lazy_raw_doc = True
+        return config
+
+
+class TestExtractionsSinglePassCleaner(TestExtractions):
+    def getConfig(self):
+        config = super().getConfig()
+        config.document_cleaner_class = SinglePassDocumentCleaner
+        return config
+
+    def test_same_document_as_standard_cleaner(self):
+        html = (
+            "<html><body class='comment'><!-- c --><article id='footer'><p>Some <em>text</em> and"
+            " <span>spans</span> <script>var a;</script> <span class='dropcap'>W</span>ith tails</p>"
+            "<div class='tools'>tools</div> <div class='meta'>x</div> <div id='x_twitter'>t</div> tail"
+            "<small><img src='a.png'/></small> <div name='sponsor'>s</div></article></body></html>"
+        )
+        config = self.getConfig()
+        standard = StandardDocumentCleaner(config, Article()).clean(Parser.fromstring(html))
+        single_pass = SinglePassDocumentCleaner(config, Article()).clean(Parser.fromstring(html))
+        self.assertEqual(Parser.nodeToString(single_pass), Parser.nodeToString(standard))
+
+    def test_invalid_cleaner_class(self):
+        config = self.getConfig()
+        with self.assertRaises(ValueError):
+            config.document_cleaner_class = Parser
+
+    def test_classifier_shared_across_documents(self):
+        config = self.getConfig()
+        config.remove_nodes_patterns = ["^shared-classifier-test$"]
+        html = "<html><body><div class='col-md-8'><p>text</p></div><div class='col-md-8'></div></body></html>"
+        first = SinglePassDocumentCleaner(config, Article())
+        first.clean(Parser.fromstring(html))
+        second = SinglePassDocumentCleaner(config, Article())
+        self.assertIs(second.classifier, first.classifier)
+        hits = first.classifier.cache_info().hits
+        second.clean(Parser.fromstring(html))
+        self.assertGreater(second.classifier.cache_info().hits, hits)
+        self.assertEqual(second.classifier.rank("class", "shared-classifier-test"), 3 + 1)
+
+    def test_standard_cleaner_shares_the_classifier(self):
+        config = self.getConfig()
+        config.remove_nodes_patterns = ["^standard-classifier-test$"]
+        html = (
+            "<html><body><div class='standard-classifier-test'>x</div><div class='col-md-8'><p>text</p></div>"
+            "<div class='col-md-8'></div></body></html>"
+        )
+        single_pass = SinglePassDocumentCleaner(config, Article())
+        standard = StandardDocumentCleaner(config, Article())
+        self.assertIs(standard.classifier, single_pass.classifier)
+        standard.clean(Parser.fromstring(html))
+        hits = standard.classifier.test.cache_info().hits
+        doc = standard.clean(Parser.fromstring(html))
+        self.assertGreater(standard.classifier.test.cache_info().hits, hits)
+        self.assertNotIn("standard-classifier-test", Parser.nodeToString(doc))
+
+    def test_set_on_a_live_instance(self):
+        html = (
+            "<html><body><div class='story'><p>A paragraph of the story, with the words of it.</p></div></body></html>"
+        )
+        cleaned = []
+
+        class RecordingCleaner(SinglePassDocumentCleaner):
+            def clean(self, doc_to_clean):
+                cleaned.append(doc_to_clean)
+                return super().clean(doc_to_clean)
+
+        with Goose() as g:
+            expected = g.extract(raw_html=html)
+            g.config.document_cleaner_class = RecordingCleaner
+            article = g.extract(raw_html=html)
+        self.assertEqual(len(cleaned), 1)
+        self.assertEqual(article.cleaned_text, expected.cleaned_text)
+
+
+class TestExtractionsGravityScoreTable(TestExtractions):
+    def getConfig(self):
+        config = super().getConfig()
+        config.gravity_score_attributes = False
+        return config
+
+    def test_retry_top_node(self):
+        article = self.getArticle()
+        self.runArticleAssertions(article=article, fields=["cleaned_text"])
+        expected = re.sub(r' gravity(Score|Nodes)="\d+"', "", self.data["expected"]["top_node_raw_html"])
+        self.assertEqual(article.top_node_raw_html, expected)
+
+    def test_no_gravity_attributes(self):
+        paragraph = "<p>Paragraph {} with the words of the language and some more of the words in it.</p>"
+        body = "".join(paragraph.format(i) for i in range(5))
+        html = f"<html><body><div class='article'>{body}</div></body></html>"
+        with Goose(self.getConfig()) as g:
+            article = g.extract(raw_html=html)
+        self.assertTrue(article.cleaned_text.startswith("Paragraph 0 with"))
+        self.assertNotIn("gravity", article.top_node_raw_html)
+        self.assertIsNone(article.top_node.get("gravityScore"))
+        self.assertGreater(article._gravity_scores.get_score(article.top_node), 0)
+
+    def test_negative_scores(self):
+        # the last paragraphs of a long article score negatively, the note ends up below one
+        paragraph = "<p>This is one of the paragraphs of the story and there is a lot to say about it in the text.</p>"
+        note = "<div class='note'><p>It is the end of it all, and there is nothing more to say about it here.</p></div>"
+        tweet = (
+            "<blockquote class='twitter-tweet'><p>And so it is for the tweet in there, at the end of it.</p>"
+            "</blockquote>"
+        )
+        html = (
+            f"<html><body><div class='story'>{paragraph * 15}<section>{paragraph * 3}{tweet}{note}</section></div>"
+            "</body></html>"
+        )
+        with Goose() as g:
+            expected = g.extract(raw_html=html)
+        with Goose(self.getConfig()) as g:
+            article = g.extract(raw_html=html)
+        self.assertIn('class="note" gravityScore="0"', expected.top_node_raw_html)
+        self.assertIn("nothing more to say", expected.cleaned_text)
+        self.assertEqual(article.cleaned_text, expected.cleaned_text)
+        self.assertEqual(article.tweets, expected.tweets)
+
+
+class EagerVectorizedContentExtractor(VectorizedContentExtractor):
+    """Uses numpy whatever the number of nodes"""
+
+    min_nodes = 0
+
+
+@unittest.skipIf(content.np is None, "numpy is not installed")
+class TestExtractionsVectorizedContentExtractor(TestExtractions):
+    def getConfig(self):
+        config = super().getConfig()
+        config.content_extractor_class = EagerVectorizedContentExtractor
+        return config
+
+    def test_invalid_content_extractor_class(self):
+        config = self.getConfig()
+        with self.assertRaises(ValueError):
+            config.content_extractor_class = StandardDocumentCleaner
+
+
 class TestExtractWithUrl(TestExtractionBase):
     def test_get_canonical_url(self):
         article = self.getArticle()
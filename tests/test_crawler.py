@@ -0,0 +1,289 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import pickle
+import time
+import unittest
+from unittest import mock
+
+from goose3 import MAX_IDLE_CRAWLERS, Configuration, Goose
+from goose3.batch import _portable_error
+from goose3.cache import MemoryCache
+from goose3.cleaners import SinglePassDocumentCleaner
+from goose3.crawler import resolve_stages
+from goose3.exceptions import DocumentTooLargeError
+from goose3.extractors.content import DensityContentExtractor, StandardContentExtractor
+from goose3.text import StopWordsChinese
+from goose3.utils.images import ImageUtils
+
+from .test_base import CURRENT_PATH, load_resource
+
+
+def load_html(folder, name):
+    return load_resource(os.path.join(CURRENT_PATH, "data", folder, f"{name}.html"))
+
+
+class TestCrawlerReuse(unittest.TestCase):
+    def extract_fresh(self, raw_html, **config):
+        with Goose(config) as g:
+            return g.extract(raw_html=raw_html)
+
+    def test_crawler_is_reused(self):
+        html = load_html("content", "test_cnn1")
+        with Goose() as g:
+            g.extract(raw_html=html)
+            self.assertEqual(len(g._crawlers), 1)
+            crawler = g._crawlers[0]
+            g.extract(raw_html=html)
+            self.assertEqual(g._crawlers, [crawler])
+
+    def test_same_results_as_a_new_instance(self):
+        docs = [load_html("content", "test_cnn1"), load_html("videos", "test_embed"), load_html("content", "test_cnn1")]
+        with Goose() as g:
+            articles = [g.extract(raw_html=html) for html in docs]
+        for html, article in zip(docs, articles):
+            expected = self.extract_fresh(html)
+            self.assertEqual(article.cleaned_text, expected.cleaned_text)
+            self.assertEqual(article.title, expected.title)
+            self.assertEqual(len(article.movies), len(expected.movies))
+        # each extraction returns its own article
+        self.assertIsNot(articles[0], articles[2])
+        self.assertEqual(articles[0].cleaned_text, articles[2].cleaned_text)
+
+    def test_configuration_changes_are_picked_up(self):
+        english = load_html("content", "test_cnn1")
+        chinese = load_html("content", "test_bbc_chinese")
+        with Goose() as g:
+            g.extract(raw_html=english)
+            g.config.stopwords_class = StopWordsChinese
+            article = g.extract(raw_html=chinese)
+        expected = self.extract_fresh(chinese, stopwords_class=StopWordsChinese)
+        self.assertEqual(article.cleaned_text, expected.cleaned_text)
+
+    def test_implementation_changes_are_picked_up(self):
+        html = load_html("content", "test_cnn1")
+        with Goose() as g:
+            g.extract(raw_html=html)
+            crawler = g._crawlers[0]
+            g.config.document_cleaner_class = SinglePassDocumentCleaner
+            g.config.content_extractor_class = DensityContentExtractor
+            article = g.extract(raw_html=html)
+        self.assertIsInstance(crawler.cleaner, SinglePassDocumentCleaner)
+        self.assertIsInstance(crawler.extractor, DensityContentExtractor)
+        expected = self.extract_fresh(
+            html, document_cleaner_class=SinglePassDocumentCleaner, content_extractor_class=DensityContentExtractor
+        )
+        self.assertEqual(article.cleaned_text, expected.cleaned_text)
+
+    def test_idle_crawlers_bounded(self):
+        with Goose() as g:
+            crawlers = [g._acquire_crawler(g.fetcher) for _ in range(MAX_IDLE_CRAWLERS + 2)]
+            for crawler in crawlers:
+                g._release_crawler(crawler)
+            self.assertEqual(len(g._crawlers), MAX_IDLE_CRAWLERS)
+
+    def test_close_drops_idle_crawlers(self):
+        g = Goose()
+        g.extract(raw_html=load_html("content", "test_cnn1"))
+        g.close()
+        self.assertEqual(g._crawlers, [])
+
+
+class TestFieldProjection(unittest.TestCase):
+    def setUp(self):
+        self.html = load_html("content", "test_cnn1")
+        with Goose() as g:
+            self.expected = g.extract(raw_html=self.html)
+
+    def test_fields_match_full_extraction(self):
+        fields = ["title", "cleaned_text", "publish_date", "meta_description", "tags", "authors", "top_node_raw_html"]
+        with Goose() as g:
+            for field in fields:
+                article = g.extract(raw_html=self.html, fields={field})
+                self.assertEqual(getattr(article, field), getattr(self.expected, field), msg=field)
+
+    def test_skipped_fields_keep_defaults(self):
+        with Goose() as g:
+            article = g.extract(raw_html=self.html, fields={"title", "publish_date"})
+        self.assertEqual(article.title, self.expected.title)
+        self.assertEqual(article.publish_date, self.expected.publish_date)
+        self.assertEqual(article.cleaned_text, "")
+        self.assertIsNone(article.top_node)
+        self.assertIsNone(article.top_node_raw_html)
+        self.assertEqual(article.links, [])
+        self.assertEqual(article.movies, [])
+        self.assertEqual(article.authors, [])
+
+    def test_unknown_field(self):
+        with Goose() as g:
+            with self.assertRaises(ValueError):
+                g.extract(raw_html=self.html, fields={"title", "not_a_field"})
+
+    def test_resolve_stages(self):
+        config = Configuration()
+        self.assertIsNone(resolve_stages(config, None))
+        self.assertEqual(resolve_stages(config, ["title"]), {"title", "opengraph", "schema", "metas", "final_url"})
+        self.assertIn("language", resolve_stages(config, ["cleaned_text"]))
+        config.use_meta_language = False
+        self.assertNotIn("language", resolve_stages(config, ["cleaned_text"]))
+        self.assertNotIn("links", resolve_stages(config, ["cleaned_text"]))
+
+
+class TestSizeLimits(unittest.TestCase):
+    def setUp(self):
+        self.html = load_html("content", "test_cnn1")
+        with Goose() as g:
+            self.expected = g.extract(raw_html=self.html)
+        self.size = len(self.html.encode("utf-8"))
+
+    def extract(self, **config):
+        with Goose(config) as g:
+            return g.extract(raw_html=self.html)
+
+    def test_within_limits(self):
+        article = self.extract(max_html_bytes=self.size, max_dom_nodes=100000)
+        self.assertFalse(article.oversized)
+        self.assertEqual(article.cleaned_text, self.expected.cleaned_text)
+
+    def test_reject(self):
+        with self.assertRaises(DocumentTooLargeError) as cm:
+            self.extract(max_html_bytes=self.size - 1)
+        self.assertEqual(
+            (cm.exception.size, cm.exception.limit, cm.exception.unit), (self.size, self.size - 1, "bytes")
+        )
+        with self.assertRaises(DocumentTooLargeError) as cm:
+            self.extract(max_dom_nodes=100)
+        self.assertEqual(cm.exception.unit, "nodes")
+        # not an error of the parser, no other parser is tried
+        self.assertNotIsInstance(cm.exception, ValueError)
+
+    def test_truncate_html(self):
+        limit = self.html.index("</head>") + 5000
+        article = self.extract(max_html_bytes=limit, oversize_policy="truncate")
+        self.assertTrue(article.oversized)
+        self.assertLessEqual(len(article.raw_html.encode("utf-8")), limit)
+        self.assertTrue(article.raw_html.endswith(">"))
+        self.assertEqual(article.title, self.expected.title)
+
+    def test_truncate_nodes(self):
+        article = self.extract(max_dom_nodes=500, oversize_policy="truncate")
+        self.assertTrue(article.oversized)
+        self.assertEqual(article.title, self.expected.title)
+        self.assertEqual(article.raw_doc.xpath("count(//*)"), 500)
+
+    def test_truncate_nodes_lazy_raw_doc(self):
+        article = self.extract(max_dom_nodes=500, oversize_policy="truncate", lazy_raw_doc=True)
+        self.assertTrue(article.oversized)
+        self.assertEqual(article.raw_doc.xpath("count(//*)"), 500)
+
+    def test_metadata(self):
+        article = self.extract(max_dom_nodes=100, oversize_policy="metadata")
+        self.assertTrue(article.oversized)
+        self.assertEqual(article.title, self.expected.title)
+        self.assertEqual(article.meta_description, self.expected.meta_description)
+        self.assertEqual(article.cleaned_text, "")
+        self.assertIsNone(article.top_node)
+
+    def test_pickle(self):
+        error = pickle.loads(pickle.dumps(DocumentTooLargeError(12, 10, "bytes")))
+        self.assertEqual((error.size, error.limit, error.unit), (12, 10, "bytes"))
+        self.assertEqual(str(error), "DocumentTooLargeError: 12 bytes over the limit of 10 bytes")
+        self.assertIsInstance(_portable_error(error), DocumentTooLargeError)
+
+    def test_invalid_settings(self):
+        config = Configuration()
+        for val in (0, -1, 1.5, "10", True):
+            with self.assertRaises(ValueError):
+                config.max_html_bytes = val
+            with self.assertRaises(ValueError):
+                config.max_dom_nodes = val
+        with self.assertRaises(ValueError):
+            config.oversize_policy = "ignore"
+
+
+class ExpiringContentExtractor(StandardContentExtractor):
+    """Runs out of time as the content scoring starts"""
+
+    def calculate_best_node(self, doc):
+        self.article._deadline = time.monotonic() - 1
+        return super().calculate_best_node(doc)
+
+
+class TestDeadline(unittest.TestCase):
+    def setUp(self):
+        self.html = load_html("content", "test_cnn1")
+        with Goose() as g:
+            self.expected = g.extract(raw_html=self.html)
+
+    def test_within_deadline(self):
+        with Goose() as g:
+            article = g.extract(raw_html=self.html, deadline=60)
+        self.assertFalse(article.deadline_exceeded)
+        self.assertEqual(article.cleaned_text, self.expected.cleaned_text)
+
+    def test_deadline_passed(self):
+        with Goose() as g:
+            article = g.extract(raw_html=self.html, deadline=-1)
+            self.assertTrue(article.deadline_exceeded)
+            self.assertEqual(article.title, "")
+            self.assertEqual(article.cleaned_text, "")
+            # the next extraction with the same crawler has its own deadline
+            article = g.extract(raw_html=self.html)
+        self.assertFalse(article.deadline_exceeded)
+        self.assertEqual(article.cleaned_text, self.expected.cleaned_text)
+
+    def test_metadata_kept(self):
+        config = Configuration()
+        config.content_extractor_class = ExpiringContentExtractor
+        with Goose(config) as g:
+            article = g.extract(raw_html=self.html, deadline=60)
+            self.assertTrue(article.deadline_exceeded)
+            self.assertEqual(article.title, self.expected.title)
+            self.assertEqual(article.meta_description, self.expected.meta_description)
+            self.assertEqual(article.publish_date, self.expected.publish_date)
+            self.assertEqual(article.cleaned_text, "")
+            self.assertIsNone(article.top_node)
+
+    def test_not_cached(self):
+        config = Configuration()
+        config.content_extractor_class = ExpiringContentExtractor
+        config.result_cache = MemoryCache()
+        with Goose(config) as g:
+            g.extract(raw_html=self.html, deadline=60)
+            self.assertEqual(config.result_cache.stats.stores, 0)
+
+    def test_image_downloads(self):
+        paragraph = "<p>This is one of the paragraphs of the article, and it is long enough to be kept in there.</p>"
+        images = "".join(f"<img src='http://example.com/image{i}.jpg'>" for i in range(30))
+        html = f"<html><head><title>Images</title></head><body><div>{paragraph * 5}{images}</div></body></html>"
+
+        def store_image(*args):
+            time.sleep(0.05)
+
+        config = Configuration()
+        config.enable_image_fetching = True
+        with Goose(config) as g, mock.patch.object(ImageUtils, "store_image", side_effect=store_image) as m:
+            article = g.extract(raw_html=html, deadline=0.3)
+        self.assertTrue(article.deadline_exceeded)
+        self.assertEqual(article.title, "Images")
+        self.assertLess(m.call_count, 30)
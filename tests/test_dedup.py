@@ -0,0 +1,133 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import random
+import unittest
+from unittest import mock
+
+from goose3 import Goose, dedup
+from goose3.dedup import (
+    SimHashIndex,
+    hamming_distance,
+    shingle_hashes,
+    simhash,
+    text_fingerprint,
+)
+from goose3.text import StopWords
+
+from .test_base import CURRENT_PATH, load_resource
+
+
+class TestSimHash(unittest.TestCase):
+    def test_empty(self):
+        self.assertIsNone(text_fingerprint("", StopWords()))
+        self.assertEqual(shingle_hashes([]), [])
+
+    def test_short_text(self):
+        self.assertEqual(len(shingle_hashes(["a", "b"])), 1)
+        self.assertEqual(len(shingle_hashes(["a", "b", "c", "d"])), 2)
+
+    def test_similar_texts(self):
+        with Goose() as g:
+            article = g.extract(raw_html=load_resource(os.path.join(CURRENT_PATH, "data", "content", "test_cnn1.html")))
+        text = article.cleaned_text
+        stopwords = StopWords()
+        original = text_fingerprint(text, stopwords)
+        edited = text_fingerprint(text.replace("the", "a", 3) + " Copyright 2024.", stopwords)
+        other = text_fingerprint("An entirely different story about something else " * 10, stopwords)
+        self.assertLessEqual(hamming_distance(original, edited), 3)
+        self.assertGreater(hamming_distance(original, other), 10)
+
+    @unittest.skipIf(dedup.np is None, "numpy is not installed")
+    def test_numpy_and_python_agree(self):
+        rnd = random.Random(42)
+        hashes = [rnd.getrandbits(64) for _ in range(1001)]
+        expected = simhash(hashes)
+        with mock.patch.object(dedup, "np", None):
+            self.assertEqual(simhash(hashes), expected)
+
+
+class TestSimHashIndex(unittest.TestCase):
+    def flip(self, value, bits):
+        for bit in bits:
+            value ^= 1 << bit
+        return value
+
+    def test_query(self):
+        index = SimHashIndex(max_distance=3)
+        rnd = random.Random(0)
+        for i in range(1000):
+            index.add(i, rnd.getrandbits(64))
+        fingerprint = rnd.getrandbits(64)
+        index.add("target", fingerprint)
+        self.assertEqual(len(index), 1001)
+
+        self.assertEqual(index.query(fingerprint), [("target", 0)])
+        # one bit in each of three different bands
+        self.assertEqual(index.query(self.flip(fingerprint, [0, 20, 40])), [("target", 3)])
+        self.assertEqual(index.query(self.flip(fingerprint, [0, 20, 40, 60])), [])
+
+    def test_add_if_new(self):
+        index = SimHashIndex(max_distance=2)
+        self.assertIsNone(index.add_if_new("a", 0b1111))
+        self.assertEqual(index.add_if_new("b", 0b1101), "a")
+        self.assertEqual(len(index), 1)
+
+    @unittest.skipIf(dedup.np is None, "numpy is not installed")
+    def test_vectorized_distances(self):
+        index = SimHashIndex(max_distance=3)
+        # all in the same buckets so that the distances are computed with numpy
+        for i in range(200):
+            index.add(i, self.flip(0, [63 - (i % 3)]) if i % 2 else 0)
+        found = index.query(0)
+        self.assertEqual(len(found), 200)
+        self.assertEqual(found[0][1], 0)
+        self.assertEqual(found[-1][1], 1)
+
+    def test_max_distance(self):
+        with self.assertRaises(ValueError):
+            SimHashIndex(max_distance=64)
+
+
+class TestArticleFingerprint(unittest.TestCase):
+    def setUp(self):
+        self.html = load_resource(os.path.join(CURRENT_PATH, "data", "content", "test_cnn1.html"))
+
+    def test_disabled_by_default(self):
+        with Goose() as g:
+            self.assertIsNone(g.extract(raw_html=self.html).fingerprint)
+
+    def test_fingerprint(self):
+        with Goose({"enable_fingerprint": True}) as g:
+            article = g.extract(raw_html=self.html)
+            copy = g.extract(raw_html=self.html.replace("</body>", "<p>Syndicated by the wire.</p></body>"))
+        self.assertIsInstance(article.fingerprint, int)
+        self.assertEqual(article.fingerprint, text_fingerprint(article.cleaned_text, StopWords()))
+        index = SimHashIndex()
+        self.assertIsNone(index.add_if_new("original", article.fingerprint))
+        self.assertEqual(index.add_if_new("copy", copy.fingerprint), "original")
+
+    def test_fingerprint_field(self):
+        with Goose() as g:
+            article = g.extract(raw_html=self.html, fields={"fingerprint"})
+        self.assertIsInstance(article.fingerprint, int)
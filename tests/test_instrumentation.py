@@ -0,0 +1,87 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import unittest
+
+import requests_mock
+
+from goose3 import Goose
+from goose3.instrumentation import GLOBAL_STATS, Recorder, count
+
+from .test_base import CURRENT_PATH, load_resource
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.html = load_resource(os.path.join(CURRENT_PATH, "data", "content", "test_cnn1.html"))
+        GLOBAL_STATS.reset()
+
+    def test_disabled_by_default(self):
+        with Goose() as g:
+            article = g.extract(raw_html=self.html)
+        self.assertEqual(article.timings, {})
+        self.assertEqual(article.counters, {})
+        self.assertEqual(GLOBAL_STATS.snapshot()["articles"], 0)
+
+    def test_timings_and_counters(self):
+        with Goose({"enable_instrumentation": True}) as g:
+            article = g.extract(raw_html=self.html)
+        for stage in ["fetch", "parse", "opengraph", "metas", "title", "clean", "calculate_best_node", "formatter"]:
+            self.assertIn(stage, article.timings)
+            self.assertEqual(article.timings[stage]["calls"], 1)
+            self.assertGreaterEqual(article.timings[stage]["wall"], 0)
+            self.assertGreaterEqual(article.timings[stage]["cpu"], 0)
+        self.assertGreaterEqual(article.counters["bytes_parsed"], len(self.html))
+        self.assertGreater(article.counters["xpath_evaluations"], 0)
+        self.assertGreater(article.counters["css_evaluations"], 0)
+        self.assertGreater(article.counters["nodes_scanned"], 0)
+        self.assertNotIn("http_requests", article.counters)
+
+    def test_http_requests(self):
+        url = "http://www.example.com/article.html"
+        with Goose({"enable_instrumentation": True}) as g, requests_mock.Mocker() as m:
+            m.get(url, text=self.html)
+            article = g.extract(url=url)
+        self.assertEqual(article.counters["http_requests"], 1)
+        self.assertIn("fetch", article.timings)
+
+    def test_global_stats(self):
+        with Goose({"enable_instrumentation": True}) as g:
+            first = g.extract(raw_html=self.html)
+            second = g.extract(raw_html=self.html)
+        stats = GLOBAL_STATS.snapshot()
+        self.assertEqual(stats["articles"], 2)
+        self.assertEqual(
+            stats["counters"]["xpath_evaluations"],
+            first.counters["xpath_evaluations"] + second.counters["xpath_evaluations"],
+        )
+        self.assertEqual(stats["timings"]["parse"]["calls"], 2)
+
+    def test_count_outside_of_an_extraction(self):
+        recorder = Recorder()
+        count("xpath_evaluations")
+        with recorder.activate():
+            count("xpath_evaluations")
+            count("bytes_parsed", 10)
+        count("xpath_evaluations")
+        self.assertEqual(recorder.counters, {"xpath_evaluations": 1, "bytes_parsed": 10})
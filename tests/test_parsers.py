@@ -23,6 +23,7 @@ limitations under the License.
 import codecs
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from goose3.parsers import Parser, ParserSoup
 from goose3.utils.constants import CAMEL_CASE_DEPRICATION
@@ -49,6 +50,71 @@ class ParserBase(unittest.TestCase):
         path = os.path.abspath(path)
         return load_resource(path)
 
+    def test_child_nodes_with_text(self):
+        doc = self.parser.fromstring("<html><body><div>first <b>bold</b> tail <i>i</i></div></body></html>")
+        div = self.parser.get_elements_by_tag(doc, tag="div")[0]
+        before = self.parser.node_to_string(div)
+        nodes = self.parser.child_nodes_with_text(div)
+        self.assertEqual([node.tag for node in nodes], ["text", "b", "text", "i"])
+        self.assertEqual([node.text for node in nodes], ["first ", "bold", " tail ", "i"])
+        # the text nodes are not inserted in the tree
+        self.assertEqual(self.parser.node_to_string(div), before)
+        self.assertIsNone(nodes[0].getparent())
+
+    def test_get_elements_by_tag_compiled_once(self):
+        html = """<html><body><p class='a"b'>quote</p><p class="link">one</p><p class="Link">two</p></body></html>"""
+        doc = self.parser.fromstring(html)
+        self.parser.get_elements_by_tag(doc, tag="p", attr="class", value="link")
+        hits = self.parser.xpath_cache_info().hits
+        # the value is not part of the compiled expression
+        elems = self.parser.get_elements_by_tag(doc, tag="p", attr="class", value="^link$")
+        self.assertEqual([elem.text for elem in elems], ["one", "two"])
+        self.assertEqual(self.parser.xpath_cache_info().hits, hits + 1)
+        elems = self.parser.get_elements_by_tag(doc, tag="p", attr="class", value='a"b')
+        self.assertEqual([elem.text for elem in elems], ["quote"])
+        # the node itself is only part of the result when selecting any tag
+        body = self.parser.get_elements_by_tag(doc, tag="body")[0]
+        self.assertEqual(len(self.parser.get_elements_by_tag(body, tag="body")), 0)
+        self.assertEqual(len(self.parser.get_elements_by_tag(body)), 4)
+        self.assertEqual(len(self.parser.get_elements_by_tag(body, childs=True)), 3)
+
+    def test_css_select_compiled_once(self):
+        html = "<html><body><p>one <span>two</span></p><p><SPAN>three</SPAN></p><span>four</span></body></html>"
+        doc = self.parser.fromstring(html)
+        self.assertEqual([elem.text for elem in self.parser.css_select(doc, "p span")], ["two", "three"])
+        hits = self.parser.css_cache_info().hits
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: len(self.parser.css_select(doc, "p span")), range(20)))
+        self.assertEqual(results, [2] * 20)
+        self.assertEqual(self.parser.css_cache_info().hits, hits + 20)
+
+    def test_nodes_to_para(self):
+        elements = [
+            "<a href='x'>one</a>",
+            "<a title='t'>two <b>b</b> <i>i</i></a>",
+            "<a><img src='i.png'/></a>",
+            "<a>q &lt; r &amp; s</a>",
+            "<a><div>block</div></a>",
+            "<a><script>if (a<b) {}</script></a>",
+        ]
+        texts = ["some text", "a > b", "x < y", "AT&T", "caf\u00e9"]
+        runs = [[text] for text in texts] + [[elm] for elm in elements]
+        runs += [[text, elm] for text in texts for elm in elements] + [
+            [elm, text] for text in texts for elm in elements
+        ]
+        runs += [[elements[0], elements[1], texts[0], elements[2]], [texts[0], elements[0], texts[1], elements[1]]]
+
+        def nodes(run):
+            html = "<html><body>{}</body></html>"
+            return [
+                item if not item.startswith("<") else Parser.fromstring(html.format(item)).find(".//a") for item in run
+            ]
+
+        for run in runs:
+            expected = self.parser.text_to_para(self.parser.nodes_to_html(nodes(run)))
+            result = self.parser.nodes_to_para(nodes(run))
+            self.assertEqual(self.parser.node_to_string(result), self.parser.node_to_string(expected), run)
+
     def test_cssselect(self):
         html = "<html><body>"
         html += '<p class="link">this is a test <a class="link">link</a> and this is <strong class="foo">strong</strong></p>'
@@ -0,0 +1,254 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+
+import lxml.html
+
+from goose3 import Configuration, Goose
+from goose3.article import Article
+from goose3.extractors import content
+from goose3.extractors.content import (
+    DensityContentExtractor,
+    StandardContentExtractor,
+    VectorizedContentExtractor,
+)
+from goose3.text import StopWords
+
+from .test_content import EagerVectorizedContentExtractor
+
+PARAGRAPH = "This is the paragraph {} of the article, with the words of the language in it."
+
+
+class CountingContentExtractor(StandardContentExtractor):
+    def __init__(self, config, article):
+        super().__init__(config, article)
+        self.updates = 0
+        self.updated = {}
+
+    def update_score(self, node, add_to_score):
+        self.updates += 1
+        self.updated[node] = self.updated.get(node, 0) + 1
+        super().update_score(node, add_to_score)
+
+
+class SelectingContentExtractor(StandardContentExtractor):
+    """Selects the links under the node and joins their text, as is_highlink_density used to"""
+
+    def is_highlink_density(self, element):
+        links = self.parser.get_elements_by_tag(element, tag="a")
+        if not links:
+            return False
+        words = self.parser.get_text(element).split(" ")
+        link_text = "".join(self.parser.get_text(link) for link in links)
+        return len(link_text.split(" ")) / len(words) * len(links) >= 1.0
+
+
+def nested_document(depth, paragraphs):
+    """`paragraphs` paragraphs at the bottom of `depth` nested divs"""
+    doc = lxml.html.fromstring("<html><body></body></html>")
+    node = doc.find("body")
+    for _ in range(depth):
+        node = lxml.html.etree.SubElement(node, "div")
+    for i in range(paragraphs):
+        lxml.html.etree.SubElement(node, "p").text = PARAGRAPH.format(i)
+    return doc, node
+
+
+class TestCalculateBestNode(unittest.TestCase):
+    def calculate_best_node(self, doc):
+        extractor = CountingContentExtractor(Configuration(), Article())
+        return extractor, extractor.calculate_best_node([doc])
+
+    def test_scaling(self):
+        # the parents are written once whatever the number of paragraphs under them; the paragraphs still add up
+        # to each of their ancestors, the work grows with the number of paragraphs times their depth
+        for depth, paragraphs in [(5, 100), (5, 10000), (50, 100)]:
+            doc, holder = nested_document(depth, paragraphs)
+            extractor, top_node = self.calculate_best_node(doc)
+            self.assertIs(top_node, holder)
+            # the divs, body and html
+            self.assertEqual(extractor.updates, depth + 2)
+            self.assertEqual(set(extractor.updated.values()), {1})
+            self.assertEqual(top_node.get("gravityNodes"), str(paragraphs))
+
+    def test_deeper_than_recursion_limit(self):
+        doc, holder = nested_document(sys.getrecursionlimit() + 100, 3)
+        extractor, top_node = self.calculate_best_node(doc)
+        self.assertIs(top_node, holder)
+        # up to the root
+        self.assertEqual(doc.get("gravityNodes"), "3")
+
+
+class TestLinkDensity(unittest.TestCase):
+    html = (
+        "<html><body><div><p>Some text <a href='#'>a link</a> and <a href='#'>another <b>bold</b> link</a>.</p>"
+        "<p><a href='#'>only a link</a></p><p><a href='#'></a><!-- a comment with words --> tail\xa0words</p>"
+        "<ul><li><a href='#'>one</a></li><li><a href='#'>two</a> <span>three <a>four five</a></span></li></ul>"
+        "<div>\n <p>Nothing to <i>see</i> here</p><a href='#'>link</a> <a href='#'>link</a></div></div></body></html>"
+    )
+
+    def test_same_as_selecting_the_links(self):
+        expected = SelectingContentExtractor(Configuration(), Article())
+        extractor = StandardContentExtractor(Configuration(), Article())
+        doc = lxml.html.fromstring(self.html)
+        for node in doc.iter(tag=lxml.html.etree.Element):
+            self.assertEqual(extractor.is_highlink_density(node), expected.is_highlink_density(node), node.tag)
+
+    def test_counted_once(self):
+        extractor = StandardContentExtractor(Configuration(), Article())
+        doc = lxml.html.fromstring(self.html)
+        nodes = list(doc.iter())
+        for node in nodes:
+            extractor.is_highlink_density(node)
+        self.assertEqual(len(extractor.node_stats._links), len(nodes))
+        self.assertEqual(extractor.node_stats.link_stats(doc.find(".//ul")), (5, 3, 2))
+
+
+@unittest.skipIf(content.np is None, "numpy is not installed")
+class TestVectorizedContentExtractor(unittest.TestCase):
+    def calculate_best_node(self, extractor_class, html):
+        doc = lxml.html.fromstring(html)
+        top_node = extractor_class(Configuration(), Article()).calculate_best_node([doc])
+        path = None if top_node is None else doc.getroottree().getpath(top_node)
+        return path, lxml.html.tostring(doc)
+
+    def test_same_as_standard(self):
+        paragraph = "<p>Paragraph {} with the words of the language and some more of them in it.</p>"
+        short = "<p>Paragraph {} with words.</p>"
+        links = "<p><a href='#'>Link {} with the words of the language</a> and <a href='#'>another</a></p>"
+        kinds = [paragraph, short, links, "<img src='a.png'>"]
+        sections = []
+        for i in range(40):
+            # boosted or not depending on the paragraphs before, up to three paragraphs away
+            items = [kinds[(i * j + j // 2) % len(kinds)] for j in range(i % 9 + 1)]
+            body = "".join(item.format(f"{i}.{j}") for j, item in enumerate(items))
+            sections.append(f"<div><div>{body}</div><table><tr><td>{paragraph.format(i)}</td></tr></table></div>")
+        for count in [0, 1, 3, 16, 40]:
+            html = f"<html><body><div>{''.join(sections[:count])}</div></body></html>"
+            self.assertEqual(
+                self.calculate_best_node(EagerVectorizedContentExtractor, html),
+                self.calculate_best_node(StandardContentExtractor, html),
+            )
+
+    def test_same_as_standard_nested(self):
+        doc, _ = nested_document(30, 100)
+        html = lxml.html.tostring(doc)
+        self.assertEqual(
+            self.calculate_best_node(VectorizedContentExtractor, html),
+            self.calculate_best_node(StandardContentExtractor, html),
+        )
+
+    def test_no_parent(self):
+        # the paragraphs scored are the roots, none of them has a parent to score
+        class RootsContentExtractor(EagerVectorizedContentExtractor):
+            def nodes_to_check(self, docs):
+                return list(docs)
+
+        paragraph = "<p>Paragraph {} with the words of the language and some more of them in it.</p>"
+        docs = [lxml.html.fromstring(paragraph.format(i)) for i in range(3)]
+        for doc in docs:
+            doc.getparent().remove(doc)
+        self.assertIsNone(RootsContentExtractor(Configuration(), Article()).calculate_best_node(docs))
+
+    def test_set_on_a_live_instance(self):
+        paragraph = "<p>Paragraph {} with the words of the language and some more of them in it.</p>"
+        html = f"<html><body><div>{''.join(paragraph.format(i) for i in range(100))}</div></body></html>"
+        with Goose() as g:
+            expected = g.extract(raw_html=html)
+            g.config.content_extractor_class = EagerVectorizedContentExtractor
+            article = g.extract(raw_html=html)
+            self.assertIsInstance(g._crawlers[0].extractor, EagerVectorizedContentExtractor)
+        self.assertEqual(article.cleaned_text, expected.cleaned_text)
+
+
+class NoStopWords(StopWords):
+    def get_stopword_count(self, content):
+        raise AssertionError("no stop words lookup expected")
+
+
+class TestDensityContentExtractor(unittest.TestCase):
+    def extract(self, html):
+        config = Configuration()
+        config.content_extractor_class = DensityContentExtractor
+        config.stopwords_class = NoStopWords
+        with Goose(config) as g:
+            return g.extract(raw_html=html)
+
+    def test_densest_node(self):
+        # a language without stop words list, paragraphs of text around a list of links and a short teaser
+        paragraph = "<p>這是文章的第{}段，內容很長，講述了一個完整的故事，包含了許多細節和描述，讓讀者可以理解事件的來龍去脈。</p>"
+        links = "".join(f"<li><a href='/{i}'>連結標題 {i}</a></li>" for i in range(30))
+        html = (
+            "<html><body><div class='menu'><ul>" + links + "</ul></div>"
+            "<div class='teaser'><p>短的介紹文字，一句話。</p></div>"
+            "<div class='story'>" + "".join(paragraph.format(i) for i in range(8)) + "</div>"
+            "<div class='more'><ul>" + links + "</ul></div></body></html>"
+        )
+        article = self.extract(html)
+        self.assertEqual(article.top_node.get("class"), "story")
+        self.assertTrue(article.cleaned_text.startswith("這是文章的第0段"))
+        self.assertIn("這是文章的第7段", article.cleaned_text)
+        self.assertNotIn("連結標題", article.cleaned_text)
+
+    def test_language_without_stop_words(self):
+        # no stop words list for khmer, the standard scoring finds no paragraph of text
+        paragraph = "<p>នេះគឺជាកថាខណ្ឌទី{}នៃអត្ថបទ ដែលមានប្រវែងវែងគ្រប់គ្រាន់ ដើម្បីរៀបរាប់ពីព្រឹត្តិការណ៍ទាំងមូល។</p>"
+        links = "".join(f"<li><a href='/{i}'>តំណភ្ជាប់ {i}</a></li>" for i in range(20))
+        html = (
+            "<html lang='km'><head><meta http-equiv='content-language' content='km'></head><body>"
+            f"<ul>{links}</ul><div class='story'>{''.join(paragraph.format(i) for i in range(6))}</div></body></html>"
+        )
+        with Goose() as g:
+            self.assertEqual(g.extract(raw_html=html).cleaned_text, "")
+            # on the same instance, the scoring and the post cleanup follow the configured extractor
+            g.config.content_extractor_class = DensityContentExtractor
+            article = g.extract(raw_html=html)
+        self.assertEqual(article.meta_lang, "km")
+        self.assertEqual(article.top_node.get("class"), "story")
+        self.assertEqual(len(article.cleaned_text.split("\n\n")), 6)
+        self.assertNotIn("តំណភ្ជាប់", article.cleaned_text)
+
+    def test_spread_over_blocks(self):
+        # the paragraphs of the article are spread over several blocks of one paragraph each
+        paragraph = (
+            "<div class='text'><p>Paragraph {} of the article, long enough to be a real paragraph of it.</p></div>"
+        )
+        html = (
+            "<html><body><div class='article'>" + "".join(paragraph.format(i) for i in range(4)) + "</div>"
+            "<div class='footer'><p>Footer text, long enough to be a paragraph of the page as well.</p></div>"
+            "</body></html>"
+        )
+        article = self.extract(html)
+        self.assertEqual(article.top_node.get("class"), "article")
+        self.assertIn("Paragraph 3 of the article", article.cleaned_text)
+
+    def test_script_not_text(self):
+        script = (
+            "<script>console.log('a long script that is no text of the document at all, whatever its size')</script>"
+        )
+        html = (
+            "<html><body><div><div>" + script * 5 + "</div><div>" + script * 5 + "</div></div>"
+            "<div><p>This is the real article, with a single paragraph of text.</p></div></body></html>"
+        )
+        self.assertEqual(self.extract(html).cleaned_text, "This is the real article, with a single paragraph of text.")
@@ -21,6 +21,7 @@ limitations under the License.
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from goose3.text import StopWords, StopWordsKorean
 
@@ -110,6 +111,30 @@ class TestStopWordsBase(unittest.TestCase):
         for found_stop_word in word_stats.get_stop_words():
             self.assertIn(found_stop_word, valid_stop_words)
 
+    def test_count_stopwords(self):
+        texts = [
+            "The Scala supported IDE is one of the few pain points of developers",
+            "  On existing\xa0long term project,\tdeveloped by a team  ",
+            "스칼라는 마틴 오더스키가 자바 제네릭 컴파일러를 개발하며",
+            "-",
+            "",
+            None,
+        ]
+        for language in [self.lang, "de"]:
+            stopwords = self.stopwords_class(language)
+            expected = [stopwords.get_stopword_count(text).get_stopword_count() for text in texts]
+            self.assertEqual([stopwords.count_stopwords(text) for text in texts], expected)
+            self.assertEqual(stopwords.count_stopwords_many(texts), expected)
+        self.assertEqual(stopwords.count_stopwords_many([]), [])
+
+    def test_for_language(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            instances = list(executor.map(self.stopwords_class.for_language, [self.lang] * 8))
+        instance = instances[0]
+        self.assertIsInstance(instance, self.stopwords_class)
+        self.assertTrue(all(x is instance for x in instances))
+        self.assertIsNot(StopWords.for_language("fr"), StopWords.for_language("en"))
+
 
 class TestStopWordsKorean(TestStopWordsBase):
     def setUp(self):
@@ -169,3 +194,6 @@ class TestStopWordsKorean(TestStopWordsBase):
         valid_stop_words = self.stopwords_class(self.lang)._stop_words
         for found_stop_word in word_stats.get_stop_words():
             self.assertIn(found_stop_word, valid_stop_words)
+
+    def test_automaton_built_once(self):
+        self.assertIs(self.stopwords_class(self.lang).auto, self.stopwords_class(self.lang).auto)
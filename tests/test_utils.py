@@ -0,0 +1,66 @@
+"""
+This is a python port of "Goose" orignialy licensed to Gravity.com
+under one or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.
+
+Python port was written by Xavier Grangier for Recrutae
+
+Gravity.com licenses this file
+to you under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from goose3 import Configuration
+from goose3.crawler import CrawlCandidate, Crawler
+from goose3.utils import RawHelper, URLHelper, blake2b_hash, fingerprint, fnv_1a
+from goose3.utils.images import ImageUtils
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_fnv_1a(self):
+        # published fnv-1a 64 bit test vectors
+        self.assertEqual(fnv_1a(b""), "cbf29ce484222325")
+        self.assertEqual(fnv_1a(b"a"), "af63dc4c8601ec8c")
+        self.assertEqual(fnv_1a("foobar"), "85944171f73967e8")
+
+    def test_blake2b(self):
+        self.assertEqual(len(blake2b_hash(b"<html></html>")), 16)
+        self.assertEqual(blake2b_hash("<html></html>"), blake2b_hash(b"<html></html>"))
+        self.assertNotEqual(blake2b_hash(b"<html></html>"), blake2b_hash(b"<html> </html>"))
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint(b"foobar"), blake2b_hash(b"foobar"))
+        self.assertEqual(fingerprint(b"foobar", "fnv_1a"), fnv_1a(b"foobar"))
+        with self.assertRaises(ValueError):
+            fingerprint(b"foobar", "md4")
+
+    def test_link_hash(self):
+        candidate = RawHelper.get_parsing_candidate("http://www.example.com", "<html></html>")
+        self.assertTrue(candidate.link_hash.startswith(f"{blake2b_hash(b'<html></html>')}."))
+        candidate = RawHelper.get_parsing_candidate("http://www.example.com", "<html></html>", "fnv_1a")
+        self.assertTrue(candidate.link_hash.startswith(f"{fnv_1a(b'<html></html>')}."))
+        candidate = URLHelper.get_parsing_candidate("http://www.example.com", "fnv_1a")
+        self.assertTrue(candidate.link_hash.startswith(f"{fnv_1a(b'http://www.example.com')}."))
+
+    def test_configuration(self):
+        config = Configuration()
+        self.assertEqual(config.fingerprint_algorithm, "blake2b")
+        with self.assertRaises(ValueError):
+            config.fingerprint_algorithm = "md4"
+        config.fingerprint_algorithm = "fnv_1a"
+        candidate = Crawler.get_parse_candidate(CrawlCandidate(config, None, "<html></html>"))
+        self.assertTrue(candidate.link_hash.startswith(f"{fnv_1a(b'<html></html>')}."))
+        name = ImageUtils.get_localfile_name("abc", "http://www.example.com/image.jpg", config)
+        self.assertTrue(name.endswith(f"abc_{fnv_1a('http://www.example.com/image.jpg')}"))